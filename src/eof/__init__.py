@@ -30,11 +30,7 @@ from eof._credentials import (
     get_data_source_preference, create_default_config,
     CONFIG_FILE,
 )
-from eof._platform_bindings import (
-    SUPPORTED_SENSORS as SENSORS,
-    SENSOR_PLATFORMS,
-    get_dataset_info,
-)
+from eof._platform_bindings import get_dataset_info
 from eof._bandpass import load_srf, get_srf_summary
 
 # Bundled test data
@@ -115,7 +111,7 @@ def get_eo_data(sensor, start_date, end_date, geojson_path,
             data_folder, max_cloud_cover,
         )
     else:
-        from eof._stac_reader import STACReader
+        from eof._stac_reader import shared_reader
         from eof._source_configs import get_config
         binding = get_binding(sensor, source)
 
@@ -131,8 +127,7 @@ def get_eo_data(sensor, start_date, end_date, geojson_path,
                 data_folder, max_cloud_cover,
             )
 
-        reader = STACReader(get_config(source))
-        return reader.fetch_sensor(
+        return shared_reader(get_config(source)).fetch_sensor(
             sensor_config, binding,
             start_date, end_date, geojson_path,
             data_folder, max_cloud_cover,
@@ -212,6 +207,17 @@ def get_eo_data_fastest(sensor, start_date, end_date, geojson_path,
 # Internal helpers
 # -----------------------------------------------------------------------
 
+def __getattr__(name):
+    # SENSORS / SENSOR_PLATFORMS are built lazily by _platform_bindings
+    if name in ("SENSORS", "SENSOR_PLATFORMS"):
+        from eof import _platform_bindings
+        source = "SUPPORTED_SENSORS" if name == "SENSORS" else name
+        value = getattr(_platform_bindings, source)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _get_reader(source, geojson_path=None):
     """Resolve source name to S2 reader instance."""
     if source == "auto":
@@ -222,9 +228,9 @@ def _get_reader(source, geojson_path=None):
         from eof._gee_reader import GEEReader
         return GEEReader()
     elif source in ("aws", "cdse", "planetary", "earthdata"):
-        from eof._stac_reader import STACReader
+        from eof._stac_reader import shared_reader
         from eof._source_configs import get_config
-        return STACReader(get_config(source))
+        return shared_reader(get_config(source))
     else:
         raise ValueError(
             f"Unknown source '{source}'. "
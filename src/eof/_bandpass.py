@@ -4,6 +4,8 @@ Provides per-band spectral response curves, center wavelengths, and FWHM
 values. SRF data is bundled as a compressed .npz file (~38 KB).
 """
 
+import functools
+
 import numpy as np
 from pathlib import Path
 
@@ -68,6 +70,13 @@ def load_srf(sensor: str, satellite: str = None) -> dict:
             'center_wavelength_nm': (n_bands,) float32 array
             'fwhm_nm': (n_bands,) float32 array
     """
+    # Shallow copy so callers can't alter the cached dict's entries
+    return dict(_build_srf(sensor, satellite))
+
+
+@functools.lru_cache(maxsize=16)
+def _build_srf(sensor: str, satellite: str = None) -> dict:
+    """Assemble the SRF dict for load_srf (memoized per sensor/satellite)."""
     data = _load_srf_data()
 
     key = (sensor, satellite)
@@ -1,11 +1,35 @@
-"""NPZ caching for downloaded EO band data."""
+"""Per-item on-disk cache for downloaded EO band data.
 
+Each item is a directory holding uncompressed bands.npy and qa.npy plus a
+meta.json sidecar with the geotransform and CRS. Loads memory-map the
+.npy files, so a cache hit only pages in what the DN conversion reads.
+Caches written by older versions (and by ARC) as a single compressed .npz
+are still readable. On first load a directory entry is written next to
+the .npz, which is kept so those tools can still use it; set
+EOF_REMOVE_LEGACY_CACHE=1 to delete it once converted.
+
+STAC search results are cached alongside, as JSON lists of item dicts
+under _stac_cache/, keyed by a hash of the search parameters and the kind
+of item dict stored.
+"""
+
+import hashlib
+import json
 import os
+import shutil
+import tempfile
+import time
+from datetime import date, timedelta
+
 import numpy as np
 
+_BANDS_FILE = "bands.npy"
+_QA_FILE = "qa.npy"
+_META_FILE = "meta.json"
+
 
 def get_cache_path(item_id: str, data_folder: str, sensor: str = None) -> str:
-    """Return the local cache file path for a STAC item.
+    """Return the local cache path (a directory) for a STAC item.
 
     Args:
         item_id: STAC item ID or GEE image ID.
@@ -15,32 +39,154 @@ def get_cache_path(item_id: str, data_folder: str, sensor: str = None) -> str:
     """
     safe_id = item_id.replace('/', '_').replace('\\', '_')
     if sensor and sensor != "sentinel2":
-        return os.path.join(data_folder, f"{sensor}_{safe_id}.npz")
-    return os.path.join(data_folder, f"{safe_id}.npz")
+        return os.path.join(data_folder, f"{sensor}_{safe_id}")
+    return os.path.join(data_folder, safe_id)
+
+
+def _legacy_path(cache_path: str) -> str:
+    return cache_path + ".npz"
+
+
+def cache_exists(cache_path: str) -> bool:
+    """True if cache_path (or its legacy .npz) holds a cached item."""
+    return (os.path.isfile(os.path.join(cache_path, _META_FILE))
+            or os.path.exists(_legacy_path(cache_path)))
 
 
 def save_to_cache(cache_path: str, band_data: np.ndarray, qa_data: np.ndarray,
                   geotransform: tuple, crs: str):
-    """Save cropped integer bands + QA to local cache."""
-    np.savez_compressed(
-        cache_path,
-        band_data=band_data,
-        scl_data=qa_data,  # keep key name for backward compat with S2 caches
-        geotransform=np.array(geotransform),
-        crs=np.array(crs),
-    )
+    """Save cropped integer bands + QA to local cache.
+
+    Files are written to a temporary directory and renamed into place, so
+    concurrent readers never see a partial entry.
+    """
+    parent = os.path.dirname(cache_path) or "."
+    tmp_dir = tempfile.mkdtemp(prefix=".tmp_", dir=parent)
+    try:
+        np.save(os.path.join(tmp_dir, _BANDS_FILE), band_data,
+                allow_pickle=False)
+        np.save(os.path.join(tmp_dir, _QA_FILE), qa_data, allow_pickle=False)
+        with open(os.path.join(tmp_dir, _META_FILE), "w") as f:
+            json.dump({"geotransform": list(geotransform), "crs": crs}, f)
+        os.replace(tmp_dir, cache_path)
+    except OSError:
+        # Another worker cached the same item first
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        if not cache_exists(cache_path):
+            raise
 
 
-def load_from_cache(cache_path: str):
+def load_from_cache(cache_path: str, remove_legacy: bool = None):
     """Load cached band data.
 
+    band_data and qa_data are read-only memory maps for directory caches.
+    remove_legacy controls whether a converted legacy .npz is deleted;
+    None defers to the EOF_REMOVE_LEGACY_CACHE environment variable.
+
     Returns:
         tuple: (band_data, qa_data, geotransform, crs)
     """
-    f = np.load(cache_path, allow_pickle=True)
+    if not os.path.isdir(cache_path):
+        if remove_legacy is None:
+            remove_legacy = os.environ.get("EOF_REMOVE_LEGACY_CACHE", "") == "1"
+        return _upgrade_legacy(cache_path, remove_legacy)
+    with open(os.path.join(cache_path, _META_FILE)) as f:
+        meta = json.load(f)
     return (
-        f['band_data'],
-        f['scl_data'],
-        tuple(f['geotransform']),
-        str(f['crs']),
+        np.load(os.path.join(cache_path, _BANDS_FILE), mmap_mode="r"),
+        np.load(os.path.join(cache_path, _QA_FILE), mmap_mode="r"),
+        tuple(meta["geotransform"]),
+        meta["crs"],
     )
+
+
+def _load_legacy(npz_path: str):
+    """Load an .npz cache written by earlier versions."""
+    with np.load(npz_path, allow_pickle=False) as f:
+        return (
+            f['band_data'],
+            f['scl_data'],
+            tuple(f['geotransform'].tolist()),
+            str(f['crs']),
+        )
+
+
+def _upgrade_legacy(cache_path: str, remove_legacy: bool = False):
+    """Load a legacy .npz entry and write it in the directory layout too.
+
+    The .npz is decompressed in full on every load, so it is converted
+    once and later loads memory-map the .npy files instead. The .npz is
+    kept (ARC and older eof versions read it) unless remove_legacy is set.
+    Failing to write the new entry is not an error; the data is still
+    returned.
+    """
+    npz_path = _legacy_path(cache_path)
+    try:
+        band_data, qa_data, geotransform, crs = _load_legacy(npz_path)
+    except FileNotFoundError:
+        # Another worker converted it between our checks
+        if os.path.isdir(cache_path):
+            return load_from_cache(cache_path)
+        raise
+    try:
+        save_to_cache(cache_path, band_data, qa_data, geotransform, crs)
+        if remove_legacy:
+            os.remove(npz_path)
+    except OSError:
+        pass
+    return band_data, qa_data, geotransform, crs
+
+
+_SEARCH_CACHE_DIR = "_stac_cache"
+# Searches ending this long ago are treated as settled and kept for
+# _SEARCH_SETTLED_MAX_AGE (catalogues still reprocess and retract items);
+# more recent ones are re-run after _SEARCH_CACHE_TTL in case new
+# acquisitions have been ingested since.
+_SEARCH_SETTLED_DAYS = 30
+_SEARCH_CACHE_TTL = 24 * 3600
+_SEARCH_SETTLED_MAX_AGE = 30 * 24 * 3600
+
+
+def search_cache_path(data_folder: str, stac_url: str, search_kwargs: dict,
+                      item_kind: str = "pystac") -> str:
+    """Path of the cached result for one STAC search in data_folder.
+
+    item_kind names the dict format stored ("pystac" for full features,
+    "raw" for RawItem.to_dict()). The formats are not interchangeable, so
+    each gets its own entry.
+    """
+    blob = json.dumps([stac_url, search_kwargs, item_kind], sort_keys=True,
+                      default=list)
+    key = hashlib.sha256(blob.encode()).hexdigest()[:32]
+    return os.path.join(data_folder, _SEARCH_CACHE_DIR, f"{key}.json")
+
+
+def load_search_cache(path: str, end_date: str):
+    """Cached item dicts for a search, or None if missing or stale."""
+    try:
+        age = time.time() - os.path.getmtime(path)
+        with open(path) as f:
+            features = json.load(f)
+    except (OSError, ValueError):
+        return None
+    try:
+        settled = (date.fromisoformat(end_date[:10])
+                   < date.today() - timedelta(days=_SEARCH_SETTLED_DAYS))
+    except ValueError:
+        settled = False
+    if age > (_SEARCH_SETTLED_MAX_AGE if settled else _SEARCH_CACHE_TTL):
+        return None
+    return features
+
+
+def save_search_cache(path: str, features: list):
+    """Write item dicts for a search atomically."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp_", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(features, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -213,10 +213,8 @@ def probe_download_speed(geojson_path: str, sources: list = None,
 
     with open(geojson_path) as f:
         features = json.load(f)["features"]
-    from shapely.geometry import shape
-    import shapely as _shapely
-    geom = shape(features[0]["geometry"])
-    geojson_dict = json.loads(_shapely.to_geojson(geom))
+    from shapely.geometry import mapping, shape
+    geojson_dict = mapping(shape(features[0]["geometry"]))
 
     results = {}
 
@@ -248,8 +246,8 @@ def _probe_single_source(source: str, geojson_dict: dict,
     gdal.PushErrorHandler('CPLQuietErrorHandler')
 
     if source == "aws":
-        gdal.SetConfigOption("AWS_NO_SIGN_REQUEST", "YES")
-        gdal.SetConfigOption("GDAL_DISABLE_READDIR_ON_OPEN", "EMPTY_DIR")
+        from eof._source_configs import _configure_gdal_for_aws
+        _configure_gdal_for_aws()
 
         client = pystac_client.Client.open("https://earth-search.aws.element84.com/v1")
         search = client.search(
@@ -265,9 +263,8 @@ def _probe_single_source(source: str, geojson_dict: dict,
         vsi_path = f"/vsicurl/{href}"
 
     elif source == "cdse":
-        from eof._source_configs import _configure_gdal_for_cdse
-        overrides = _configure_gdal_for_cdse()
-        vsi_prefix = overrides.get("vsi_prefix", "/vsicurl")
+        from eof._source_configs import get_config
+        vsi_prefix = get_config("cdse").configure().vsi_prefix
 
         client = pystac_client.Client.open("https://stac.dataspace.copernicus.eu/v1")
         search = client.search(
@@ -394,18 +391,19 @@ def benchmark_sources(geojson_path: str = None, sensors: list = None,
 
     # Build list of (sensor, platform) combos to test
     combos = []
-    for (sensor, platform) in BINDINGS:
+    for sensor, platforms in BINDINGS.items():
         if sensors and sensor not in sensors:
             continue
-        if platform not in available:
-            continue
-        if platform == "gee":
-            continue  # GEE timing is server-dominated, not meaningful
-        info = get_dataset_info(sensor, platform)
-        fmt = info.get("format", "cog")
-        if fmt in ("hdf4", "hdf5"):
-            continue  # Skip HDF downloads for benchmarking
-        combos.append((sensor, platform))
+        for platform in platforms:
+            if platform not in available:
+                continue
+            if platform == "gee":
+                continue  # GEE timing is server-dominated, not meaningful
+            info = get_dataset_info(sensor, platform)
+            fmt = info.get("format", "cog")
+            if fmt in ("hdf4", "hdf5"):
+                continue  # Skip HDF downloads for benchmarking
+            combos.append((sensor, platform))
 
     results = {}
 
@@ -439,19 +437,15 @@ def _probe_sensor_source(sensor: str, platform: str,
     gdal.PushErrorHandler('CPLQuietErrorHandler')
 
     binding = get_binding(sensor, platform)
-    cfg = get_config(platform)
-
     # Configure GDAL
-    overrides = cfg.configure_gdal()
-    vsi_prefix = overrides.get("vsi_prefix", cfg.vsi_prefix)
+    cfg = get_config(platform).configure()
+    vsi_prefix = cfg.vsi_prefix
 
     # Load geometry for search
     with open(geojson_path) as f:
         features = json.load(f)["features"]
-    from shapely.geometry import shape
-    import shapely as _shapely
-    geom = shape(features[0]["geometry"])
-    geojson_dict = json.loads(_shapely.to_geojson(geom))
+    from shapely.geometry import mapping, shape
+    geojson_dict = mapping(shape(features[0]["geometry"]))
 
     # STAC search for one item
     client = pystac_client.Client.open(cfg.stac_url)
@@ -0,0 +1,13 @@
+"""Date helpers shared by the readers."""
+
+from datetime import date
+
+
+def day_of_year(dt) -> int:
+    """Day of year (1-366) of a date/datetime without building a struct_time."""
+    return dt.toordinal() - date(dt.year, 1, 1).toordinal() + 1
+
+
+def date_from_yyyymmdd(text: str) -> date:
+    """Parse a 'YYYYMMDD' string (e.g. from a product ID) without strptime."""
+    return date(int(text[:4]), int(text[4:6]), int(text[6:8]))
@@ -9,18 +9,18 @@ not as per-band COGs. This reader:
 """
 
 import os
-import json
 import tempfile
 import threading
 import numpy as np
 from osgeo import gdal
 import pystac_client
-import shapely
+from shapely.geometry import mapping
 
 from eof._types import EOResult
 from eof._source_configs import SourceConfig
-from eof._sensor_configs import SensorConfig
+from eof._sensor_configs import SensorConfig, all_nan_mask, mask_invalid
 from eof._platform_bindings import SensorPlatformBinding
+from eof._dates import day_of_year
 from eof._geojson import load_geojson
 from eof._footprints import compute_all_footprints
 from eof._bandpass import load_srf
@@ -73,10 +73,8 @@ class EarthdataHDFReader:
         import requests
 
         sensor = sensor_config.name
-        cfg = self.config
-
         # Configure GDAL for Earthdata access
-        cfg.configure_gdal()
+        cfg = self.config.configure()
 
         if data_folder is None:
             data_folder = tempfile.mkdtemp(prefix=f"{sensor}_earthdata_")
@@ -85,7 +83,7 @@ class EarthdataHDFReader:
 
         # Load geometry
         geometry = load_geojson(geojson_path)
-        geojson_dict = json.loads(shapely.to_geojson(geometry))
+        geojson_dict = mapping(geometry)
 
         # STAC search
         client = pystac_client.Client.open(cfg.stac_url)
@@ -107,12 +105,12 @@ class EarthdataHDFReader:
             )
 
         # Extract DOYs
-        doys = np.array([
-            item.datetime.timetuple().tm_yday for item in items
-        ], dtype=np.int64)
+        doys = np.fromiter((day_of_year(item.datetime) for item in items),
+                           dtype=np.int64, count=len(items))
 
         # Download HDF files and extract bands
-        reflectances = []
+        refs = None
+        n_read = 0
         geotransform = None
         crs = None
         szas, vzas, raas = [], [], []
@@ -132,25 +130,29 @@ class EarthdataHDFReader:
                 crs = proj
 
             # DN to reflectance
-            refl = sensor_config.dn_to_reflectance(bands)
+            refl, valid = sensor_config.dn_to_reflectance(bands)
 
             # Cloud masking
             if sensor_config.cloud_mask_fn is not None and qa is not None:
-                cloud_mask = sensor_config.cloud_mask_fn(qa)
-                refl[:, cloud_mask] = np.nan
-
-            reflectances.append(refl)
+                valid &= ~sensor_config.cloud_mask_fn(qa)
+            mask_invalid(refl, valid)
+
+            # Fill the next slot of the output stack, sized on first read
+            if refs is None:
+                refs = np.empty((len(items),) + refl.shape, dtype=np.float32)
+            refs[n_read] = refl
+            n_read += 1
             szas.append(angles[0])
             vzas.append(angles[1])
             raas.append(angles[2])
 
-        if not reflectances:
+        if not n_read:
             raise RuntimeError(f"No valid {sensor} data extracted from Earthdata.")
 
-        refs = np.array(reflectances, dtype=np.float32)
+        refs = refs[:n_read]
         uncs = sensor_config.uncertainty_fn(refs)
-        mask = np.all(np.isnan(refs), axis=(0, 1))
-        angles = np.array([szas, vzas, raas], dtype=np.float64)
+        mask = all_nan_mask(refs)
+        angles = np.array([szas, vzas, raas], dtype=np.float32)
 
         # Footprint maps
         shape_hw = refs.shape[2:]
@@ -166,7 +168,7 @@ class EarthdataHDFReader:
             reflectance=refs,
             uncertainty=uncs,
             angles=angles,
-            doys=doys[:len(reflectances)],
+            doys=doys[:n_read],
             mask=mask,
             geotransform=geotransform,
             crs=crs,
@@ -10,9 +10,19 @@ are marked as invalid (ID = -1 in signed representation, max value in
 unsigned dtype).
 """
 
+import hashlib
 import math
+import threading
+from collections import OrderedDict
+
 import numpy as np
 
+# LRU of compute_all_footprints results; repeat fetches over the same AOI
+# produce identical grids and masks.
+_FOOTPRINT_CACHE = OrderedDict()
+_FOOTPRINT_CACHE_SIZE = 8
+_footprint_lock = threading.Lock()
+
 
 def compute_footprint_ids(geotransform, shape_hw, native_resolution,
                           target_resolution=10, mask=None,
@@ -120,10 +130,28 @@ def compute_all_footprints(geotransform, shape_hw, resolution_groups,
     Returns:
         dict: {resolution_m: np.ndarray} footprint ID maps.
     """
-    footprints = {}
-    for resolution in resolution_groups:
-        footprints[resolution] = compute_footprint_ids(
-            geotransform, shape_hw, resolution, target_resolution,
-            mask=mask, min_valid_fraction=min_valid_fraction,
-        )
-    return footprints
+    mask_key = None
+    if mask is not None:
+        mask = np.asarray(mask, dtype=bool)
+        mask_key = hashlib.blake2b(mask.tobytes(), digest_size=16).digest()
+    key = (tuple(geotransform), tuple(shape_hw), tuple(resolution_groups),
+           target_resolution, min_valid_fraction, mask_key)
+
+    with _footprint_lock:
+        cached = _FOOTPRINT_CACHE.get(key)
+        if cached is not None:
+            _FOOTPRINT_CACHE.move_to_end(key)
+    if cached is None:
+        cached = {}
+        for resolution in resolution_groups:
+            cached[resolution] = compute_footprint_ids(
+                geotransform, shape_hw, resolution, target_resolution,
+                mask=mask, min_valid_fraction=min_valid_fraction,
+            )
+        with _footprint_lock:
+            _FOOTPRINT_CACHE[key] = cached
+            while len(_FOOTPRINT_CACHE) > _FOOTPRINT_CACHE_SIZE:
+                _FOOTPRINT_CACHE.popitem(last=False)
+
+    # Copies, so callers can modify their result without touching the cache
+    return {resolution: ids.copy() for resolution, ids in cached.items()}
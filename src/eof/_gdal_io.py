@@ -1,8 +1,21 @@
-"""GDAL warp/read utilities with semaphore-based concurrency."""
+"""GDAL warp/read utilities.
+
+Concurrency is bounded by the caller's band pool, not here. osgeo.gdal
+is imported on first use, so importing the readers does not initialise
+GDAL.
+"""
+
+import functools
 
-import threading
 import numpy as np
-from osgeo import gdal
+
+
+@functools.lru_cache(maxsize=None)
+def quiet_gdal():
+    """Import osgeo.gdal and silence its error output, once per process."""
+    from osgeo import gdal
+    gdal.PushErrorHandler('CPLQuietErrorHandler')
+    return gdal
 
 
 def build_vsi_path(href: str, vsi_prefix: str = "/vsicurl",
@@ -35,43 +48,102 @@ def build_vsi_path(href: str, vsi_prefix: str = "/vsicurl",
         return href
 
 
-def read_and_crop_band(href: str, geojson_cutline: str, semaphore: threading.Semaphore,
+def read_and_crop_band(href: str, geojson_cutline: str,
                        vsi_prefix: str = "/vsicurl",
                        transform_href=None,
                        s3_endpoint: str = None,
                        target_resolution: int = 10,
-                       resample_alg: str = 'bilinear') -> tuple:
+                       resample_alg: str = 'bilinear',
+                       data_type: str = 'int16',
+                       num_threads: int = None) -> tuple:
     """
     Read a single band, crop to field boundary, resample to target resolution.
 
+    Spectral bands are read as int16; QA bands should pass their native
+    unsigned type (e.g. 'uint8' for SCL) so bit flags are kept intact.
+    num_threads is passed to warp_band.
+
     Returns:
         tuple: (data, geotransform, crs)
     """
     vsi_path = build_vsi_path(href, vsi_prefix, transform_href, s3_endpoint)
+    return warp_band(vsi_path, geojson_cutline, target_resolution,
+                     resample_alg, data_type, num_threads)
+
+
+def warp_band(vsi_path: str, geojson_cutline: str, target_resolution: int = 10,
+              resample_alg: str = 'bilinear', data_type: str = 'int16',
+              num_threads: int = None) -> tuple:
+    """
+    Warp an already-resolved VSI path to the field boundary.
+
+    Takes only picklable arguments so it can run in a process pool.
+    num_threads caps GDAL's decode and warp-kernel threads for this read;
+    callers running several reads at once pass their share of the CPUs.
+    None uses all of them.
+
+    Returns:
+        tuple: (data, geotransform, crs)
+    """
+    from osgeo import gdal
 
     resample_map = {
         'bilinear': gdal.GRA_Bilinear,
         'nearest': gdal.GRA_NearestNeighbour,
     }
+    type_map = {
+        'uint8': gdal.GDT_Byte,
+        'int16': gdal.GDT_Int16,
+        'uint16': gdal.GDT_UInt16,
+        'uint32': gdal.GDT_UInt32,
+    }
+
+    threads = f"NUM_THREADS={num_threads or 'ALL_CPUS'}"
+    # NUM_THREADS lets GTiff decode the tiles of one read in parallel
+    # (GDAL >= 3.6); drivers without the option ignore it. The driver
+    # fetches the tiles' byte ranges on the calling thread and hands only
+    # the decoding to its workers, so thread-local source options (auth,
+    # endpoints) still apply to every request.
+    src = gdal.OpenEx(vsi_path, gdal.OF_RASTER, open_options=[threads])
+    if src is None:
+        raise IOError(f"Failed to open {vsi_path}")
+
+    # The warp is not run multithreaded: that reads source chunks from
+    # threads GDAL spawns, which do not see thread-local config options
+    # on every GDAL version. Its kernel threads only compute.
+    ds = gdal.Warp(
+        '', src,
+        format='MEM',
+        warpOptions=[threads],
+        cutlineDSName=geojson_cutline,
+        cropToCutline=True,
+        xRes=target_resolution,
+        yRes=target_resolution,
+        resampleAlg=resample_map.get(resample_alg, gdal.GRA_Bilinear),
+        dstNodata=0,
+        outputType=type_map.get(data_type, gdal.GDT_Int16),
+    )
+    src = None
+    if ds is None:
+        raise IOError(f"Failed to read band from {vsi_path}")
 
-    with semaphore:
-        ds = gdal.Warp(
-            '', vsi_path,
-            format='MEM',
-            cutlineDSName=geojson_cutline,
-            cropToCutline=True,
-            xRes=target_resolution,
-            yRes=target_resolution,
-            resampleAlg=resample_map.get(resample_alg, gdal.GRA_Bilinear),
-            dstNodata=0,
-            outputType=gdal.GDT_Int16,
-        )
-        if ds is None:
-            raise IOError(f"Failed to read band from {vsi_path}")
-
-        data = ds.ReadAsArray()
-        gt = ds.GetGeoTransform()
-        crs = ds.GetProjection()
-        ds = None
+    data = ds.ReadAsArray()
+    gt = ds.GetGeoTransform()
+    crs = ds.GetProjection()
+    ds = None
 
     return data, gt, crs
+
+
+def open_header(vsi_path: str) -> bool:
+    """Open (and close) a remote raster so its header lands in GDAL's caches.
+
+    Used to warm a file's header ahead of its band read; failures are left
+    for the real read to report.
+    """
+    from osgeo import gdal
+
+    ds = gdal.OpenEx(vsi_path, gdal.OF_RASTER)
+    ok = ds is not None
+    ds = None
+    return ok
@@ -11,12 +11,13 @@ import tempfile
 import datetime
 import numpy as np
 from osgeo import gdal
-import mgrs
 
 from eof._types import S2Result, EOResult
-from eof._geojson import load_geojson
+from eof._dates import date_from_yyyymmdd, day_of_year
+from eof._geojson import load_geojson, mgrs_tile
 from eof._footprints import compute_all_footprints
 from eof._bandpass import load_srf
+from eof._sensor_configs import _default_uncertainty, all_nan_mask
 
 gdal.PushErrorHandler('CPLQuietErrorHandler')
 
@@ -66,14 +67,13 @@ class GEEReader:
         ee_geometry = ee.Geometry.Polygon(coords)
 
         # Get MGRS tile
-        m = mgrs.MGRS()
-        mgrs_tile = m.toMGRS(latitude, longitude)[:5]
+        tile = mgrs_tile(latitude, longitude)
 
         # Filter S2 collection
         s2 = ee.ImageCollection("COPERNICUS/S2_SR_HARMONIZED")
         s2 = (s2.filterBounds(ee_geometry)
                 .filterDate(start_date, end_date)
-                .filterMetadata('MGRS_TILE', 'equals', mgrs_tile)
+                .filterMetadata('MGRS_TILE', 'equals', tile)
                 .sort("system:time_start"))
         features = s2.getInfo()['features']
 
@@ -83,19 +83,18 @@ class GEEReader:
                 f"field and date range ({start_date} to {end_date})."
             )
 
-        print(f"GEE search: {len(features)} images found on tile {mgrs_tile}")
+        print(f"GEE search: {len(features)} images found on tile {tile}")
 
         # Calculate angles
-        szas, vzas, raas = self._calculate_angles(features)
-        s2_angles = np.array([szas, vzas, raas])
-
-        # Get DOYs
-        doys = np.array([
-            datetime.datetime.strptime(
-                feat['properties']['PRODUCT_ID'].split('_')[2][:8], '%Y%m%d'
-            ).timetuple().tm_yday
-            for feat in features
-        ])
+        s2_angles = self._calculate_angles(features)
+
+        # Get DOYs (acquisition date is the third PRODUCT_ID field)
+        doys = np.fromiter(
+            (day_of_year(date_from_yyyymmdd(
+                feat['properties']['PRODUCT_ID'].split('_')[2][:8]))
+             for feat in features),
+            dtype=np.int64, count=len(features),
+        )
 
         # Download images
         bands = ['B2', 'B3', 'B4', 'B5', 'B6', 'B7', 'B8', 'B8A',
@@ -138,10 +137,10 @@ class GEEReader:
                     shutil.copyfileobj(r.raw, out_file)
 
         # Read and process downloaded files — read as int16, convert client-side
-        s2_reflectances = []
+        s2_refs = None
         geotransform = None
         crs = None
-        for filename in filenames:
+        for i, filename in enumerate(filenames):
             g = gdal.Warp(
                 '', filename,
                 format='MEM',
@@ -163,15 +162,19 @@ class GEEReader:
             cs_cdf = data[12]   # cloud score CDF (0-100 scaled)
             cloud_mask = (cs_cdf < 70) | (data[0] > 3000) | (data[13] > 100)
 
-            # Convert spectral bands (first 10) to float reflectance
-            spectral = data[:10].astype(np.float32) / 10000.0
-            spectral[:, cloud_mask] = np.nan
-            s2_reflectances.append(spectral)
+            # Convert spectral bands (first 10) to float reflectance,
+            # straight into this item's slot of the output stack
+            if s2_refs is None:
+                s2_refs = np.empty((len(filenames), 10) + data.shape[1:],
+                                   dtype=np.float32)
+            spectral = s2_refs[i]
+            np.divide(data[:10], np.float32(10000.0), out=spectral,
+                      casting='unsafe')
+            np.copyto(spectral, np.nan, where=cloud_mask)
 
-        s2_refs = np.array(s2_reflectances, dtype=np.float32)
-        s2_uncs = np.abs(s2_refs) * 0.1
+        s2_uncs = _default_uncertainty(s2_refs)
 
-        mask = np.all(np.isnan(s2_refs), axis=(0, 1))
+        mask = all_nan_mask(s2_refs)
 
         return S2Result(
             reflectance=s2_refs,
@@ -203,7 +206,7 @@ class GEEReader:
         import ee
         import requests
         import shutil
-        from eof._sensor_configs import get_sensor_config
+        from eof._sensor_configs import get_sensor_config, mask_invalid
         from eof._platform_bindings import get_binding
 
         sensor_config = get_sensor_config(sensor)
@@ -242,30 +245,25 @@ class GEEReader:
         print(f"GEE search ({sensor}): {len(features)} images found")
 
         # Extract angles and DOYs
-        szas, vzas, raas, doys = [], [], [], []
-        for feat in features:
+        angles = np.empty((3, len(features)), dtype=np.float32)
+        doys_arr = np.empty(len(features), dtype=np.int64)
+        for i, feat in enumerate(features):
             props = feat['properties']
-            sza, vza, raa = self._extract_sensor_angles(sensor, props)
-            szas.append(sza)
-            vzas.append(vza)
-            raas.append(raa)
+            angles[:, i] = self._extract_sensor_angles(sensor, props)
             # DOY from system:time_start
             ts = props.get('system:time_start', 0)
-            dt = datetime.datetime.utcfromtimestamp(ts / 1000)
-            doys.append(dt.timetuple().tm_yday)
-
-        angles = np.array([szas, vzas, raas], dtype=np.float64)
-        doys_arr = np.array(doys, dtype=np.int64)
+            doys_arr[i] = day_of_year(
+                datetime.datetime.utcfromtimestamp(ts / 1000))
 
         # Download images
         all_bands = list(band_names) + [qa_band]
         scale = sensor_config.target_resolution
 
-        reflectances = []
+        refs = None
         geotransform = None
         crs = None
 
-        for feat in features:
+        for i, feat in enumerate(features):
             image_id = feat['id']
             safe_id = image_id.replace('/', '_')
             filename = os.path.join(data_folder, f"{sensor}_{safe_id}.tif")
@@ -309,18 +307,20 @@ class GEEReader:
             qa_data = data[n_spectral]
 
             # DN to reflectance
-            refl = sensor_config.dn_to_reflectance(spectral_dn)
+            refl, valid = sensor_config.dn_to_reflectance(spectral_dn)
 
             # Cloud masking
             if sensor_config.cloud_mask_fn is not None:
-                cloud_mask = sensor_config.cloud_mask_fn(qa_data)
-                refl[:, cloud_mask] = np.nan
+                valid &= ~sensor_config.cloud_mask_fn(qa_data)
+            mask_invalid(refl, valid)
 
-            reflectances.append(refl)
+            # Fill this item's slot of the output stack, sized on first read
+            if refs is None:
+                refs = np.empty((len(features),) + refl.shape, dtype=np.float32)
+            refs[i] = refl
 
-        refs = np.array(reflectances, dtype=np.float32)
         uncs = sensor_config.uncertainty_fn(refs)
-        mask = np.all(np.isnan(refs), axis=(0, 1))
+        mask = all_nan_mask(refs)
 
         # Footprint maps (with edge exclusion using mask)
         shape_hw = refs.shape[2:]
@@ -366,11 +366,10 @@ class GEEReader:
 
         if sensor == "sentinel2":
             # Special handling: use MGRS tile filter
-            m = mgrs.MGRS()
             centroid = ee_geometry.centroid().coordinates().getInfo()
-            mgrs_tile = m.toMGRS(centroid[1], centroid[0])[:5]
+            tile = mgrs_tile(centroid[1], centroid[0])
             collection = collection.filterMetadata(
-                'MGRS_TILE', 'equals', mgrs_tile
+                'MGRS_TILE', 'equals', tile
             )
 
         if sensor == "landsat":
@@ -432,12 +431,8 @@ class GEEReader:
         return sza, vza, raa
 
     def _calculate_angles(self, features):
-        """Calculate SZA, VZA, RAA from GEE feature properties (S2 only)."""
-        szas, vzas, raas = [], [], []
-        for feat in features:
-            sza, vza, raa = self._s2_angles_from_props(feat['properties'])
-            szas.append(sza)
-            vzas.append(vza)
-            raas.append(raa)
-
-        return np.array(szas), np.array(vzas), np.array(raas)
+        """(3, N) array of SZA, VZA, RAA from GEE feature properties (S2 only)."""
+        angles = np.empty((3, len(features)), dtype=np.float32)
+        for i, feat in enumerate(features):
+            angles[:, i] = self._s2_angles_from_props(feat['properties'])
+        return angles
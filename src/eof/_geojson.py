@@ -1,8 +1,11 @@
-"""GeoJSON loading utilities."""
+"""GeoJSON loading and MGRS tile utilities."""
 
+import functools
 import json
 from shapely.geometry import shape
 
+_MGRS = None
+
 
 def load_geojson(file_path: str):
     """Load a GeoJSON file and return the first feature's geometry as a shapely object."""
@@ -12,3 +15,17 @@ def load_geojson(file_path: str):
     if not geom.is_valid:
         geom = geom.buffer(0)
     return geom
+
+
+@functools.lru_cache(maxsize=64)
+def mgrs_tile(latitude: float, longitude: float) -> str:
+    """5-character MGRS tile code (e.g. "30UXC") containing a point.
+
+    The converter is built once per process and lookups are memoized, so
+    repeat fetches over the same field skip the conversion entirely.
+    """
+    global _MGRS
+    if _MGRS is None:
+        import mgrs
+        _MGRS = mgrs.MGRS()
+    return _MGRS.toMGRS(latitude, longitude)[:5]
@@ -16,13 +16,12 @@ from eof._source_configs import SOURCE_CONFIGS, get_config
 def _fetch_from_stac(sensor, platform, start_date, end_date, geojson_path,
                      data_folder, max_cloud_cover):
     """Attempt to fetch via STAC reader from a given platform."""
-    from eof._stac_reader import STACReader
+    from eof._stac_reader import shared_reader
 
     source_config = get_config(platform)
     sensor_config = get_sensor_config(sensor)
     binding = get_binding(sensor, platform)
-    reader = STACReader(source_config)
-    return reader.fetch_sensor(
+    return shared_reader(source_config).fetch_sensor(
         sensor_config, binding,
         start_date, end_date, geojson_path,
         data_folder, max_cloud_cover,
@@ -7,6 +7,7 @@ Collection IDs are loaded from data/dataset_versions.json so they can
 be updated independently of the code (see scripts/update_dataset_versions.py).
 """
 
+import functools
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -29,6 +30,7 @@ def _load_versions():
     return _VERSIONS_CACHE
 
 
+@functools.lru_cache(maxsize=32)
 def get_collection_id(sensor: str, platform: str) -> str:
     """Look up the collection ID for a sensor x platform from the config."""
     versions = _load_versions()
@@ -37,6 +39,7 @@ def get_collection_id(sensor: str, platform: str) -> str:
     return platform_info.get("collection", "")
 
 
+@functools.lru_cache(maxsize=32)
 def get_dataset_info(sensor: str, platform: str) -> dict:
     """Get full dataset info (collection, version, temporal, notes)."""
     versions = _load_versions()
@@ -219,56 +222,65 @@ S3_OLCI_GEE = SensorPlatformBinding(
 # Registry
 # -----------------------------------------------------------------------
 
-BINDINGS: Dict[tuple, SensorPlatformBinding] = {
+# sensor -> platform -> binding; nested so lookups need no key tuple
+BINDINGS: Dict[str, Dict[str, SensorPlatformBinding]] = {}
+for _binding in (
     # Sentinel-2
-    ("sentinel2", "aws"): S2_AWS,
-    ("sentinel2", "cdse"): S2_CDSE,
-    ("sentinel2", "planetary"): S2_PLANETARY,
-    ("sentinel2", "gee"): S2_GEE,
-    ("sentinel2", "earthdata"): S2_EARTHDATA,
+    S2_AWS, S2_CDSE, S2_PLANETARY, S2_GEE, S2_EARTHDATA,
     # Landsat
-    ("landsat", "aws"): LANDSAT_AWS,
-    ("landsat", "planetary"): LANDSAT_PLANETARY,
-    ("landsat", "gee"): LANDSAT_GEE,
-    ("landsat", "earthdata"): LANDSAT_EARTHDATA,
+    LANDSAT_AWS, LANDSAT_PLANETARY, LANDSAT_GEE, LANDSAT_EARTHDATA,
     # MODIS
-    ("modis", "planetary"): MODIS_PLANETARY,
-    ("modis", "gee"): MODIS_GEE,
-    ("modis", "earthdata"): MODIS_EARTHDATA,
+    MODIS_PLANETARY, MODIS_GEE, MODIS_EARTHDATA,
     # VIIRS
-    ("viirs", "gee"): VIIRS_GEE,
-    ("viirs", "earthdata"): VIIRS_EARTHDATA,
+    VIIRS_GEE, VIIRS_EARTHDATA,
     # Sentinel-3 OLCI
-    ("s3olci", "gee"): S3_OLCI_GEE,
-}
+    S3_OLCI_GEE,
+):
+    BINDINGS.setdefault(_binding.sensor, {})[_binding.platform] = _binding
+del _binding
 
 
 def get_binding(sensor: str, platform: str) -> SensorPlatformBinding:
     """Get binding for a sensor+platform combination."""
-    key = (sensor, platform)
-    if key not in BINDINGS:
-        available = [p for (s, p) in BINDINGS if s == sensor]
+    try:
+        return BINDINGS[sensor][platform]
+    except KeyError:
+        available = list(BINDINGS.get(sensor, {}))
         raise ValueError(
             f"No binding for sensor='{sensor}' on platform='{platform}'. "
             f"Available platforms for {sensor}: {available}"
-        )
-    return BINDINGS[key]
+        ) from None
 
 
 def get_platforms_for_sensor(sensor: str) -> list:
     """List available platforms for a given sensor."""
-    return [p for (s, p) in BINDINGS if s == sensor]
+    return list(BINDINGS.get(sensor, {}))
 
 
 def get_sensors_for_platform(platform: str) -> list:
     """List available sensors on a given platform."""
-    return [s for (s, p) in BINDINGS if p == platform]
-
-
-# Convenience lookups
-SENSOR_PLATFORMS = {
-    sensor: get_platforms_for_sensor(sensor)
-    for sensor in {"sentinel2", "landsat", "modis", "viirs", "s3olci"}
-}
-
-SUPPORTED_SENSORS = list(SENSOR_PLATFORMS.keys())
+    return [s for s, platforms in BINDINGS.items() if platform in platforms]
+
+
+# Convenience lookups, built on first access (PEP 562) so importing the
+# registry does not pay for a scan of BINDINGS per sensor. BIND_<SENSOR>_
+# <PLATFORM> (e.g. BIND_SENTINEL2_AWS) resolves to that pair's binding.
+def __getattr__(name):
+    if name.startswith("BIND_"):
+        sensor, _, platform = name[len("BIND_"):].rpartition("_")
+        try:
+            value = BINDINGS[sensor.lower()][platform.lower()]
+        except KeyError:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}") from None
+    elif name == "SENSOR_PLATFORMS":
+        value = {
+            sensor: get_platforms_for_sensor(sensor)
+            for sensor in {"sentinel2", "landsat", "modis", "viirs", "s3olci"}
+        }
+    elif name == "SUPPORTED_SENSORS":
+        value = list(__getattr__("SENSOR_PLATFORMS").keys())
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
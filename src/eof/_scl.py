@@ -3,6 +3,16 @@
 import numpy as np
 from eof._types import SCL_MASK_VALUES, QUANTIFICATION_VALUE, BASELINE_OFFSET
 
+# Lookup table over all uint8 SCL codes: True where the class is masked
+_SCL_MASK_LUT = np.zeros(256, dtype=bool)
+_SCL_MASK_LUT[sorted(SCL_MASK_VALUES)] = True
+
+
+def scl_cloud_mask(scl: np.ndarray) -> np.ndarray:
+    """Boolean mask, True where the SCL class is one of SCL_MASK_VALUES."""
+    # SCL arrives as uint8 (int16 in older caches); clip keeps codes in the LUT
+    return np.take(_SCL_MASK_LUT, scl, mode='clip')
+
 
 def apply_scl_cloud_mask(reflectance: np.ndarray, scl: np.ndarray) -> np.ndarray:
     """
@@ -10,28 +20,63 @@ def apply_scl_cloud_mask(reflectance: np.ndarray, scl: np.ndarray) -> np.ndarray
 
     Masked classes: 0=NoData, 1=Saturated, 3=CloudShadow,
     8=CloudMedium, 9=CloudHigh, 10=Cirrus, 11=Snow
+
+    The reflectance array is modified in place; the (H, W) mask is
+    broadcast over bands rather than expanded.
     """
-    mask = np.isin(scl, list(SCL_MASK_VALUES))
-    reflectance[:, mask] = np.nan
+    np.copyto(reflectance, np.nan, where=scl_cloud_mask(scl))
     return reflectance
 
 
-def dn_to_reflectance(dn: np.ndarray, processing_baseline: str) -> np.ndarray:
+def _dn_to_reflectance_v4plus(dn: np.ndarray) -> np.ndarray:
+    """DN to reflectance for baseline >= 04.00 (BOA_ADD_OFFSET applied)."""
+    # Cast and offset in one pass, with no intermediate copy of the DNs
+    refl = np.add(dn, np.float32(BASELINE_OFFSET), dtype=np.float32)
+    refl /= np.float32(QUANTIFICATION_VALUE)
+    np.maximum(refl, np.float32(0.0), out=refl)
+    return refl
+
+
+def _dn_to_reflectance_legacy(dn: np.ndarray) -> np.ndarray:
+    """DN to reflectance for baselines before 04.00 (no offset)."""
+    refl = np.divide(dn, np.float32(QUANTIFICATION_VALUE), dtype=np.float32)
+    np.maximum(refl, np.float32(0.0), out=refl)
+    return refl
+
+
+# processing baseline string -> specialized converter
+_BASELINE_CACHE = {}
+
+
+def get_dn_converter(processing_baseline: str):
     """
-    Convert integer DN values to float32 reflectance [0, 1].
+    Return the DN-to-reflectance function for a processing baseline.
 
-    For processing baseline >= 04.00, applies BOA_ADD_OFFSET of -1000.
+    The baseline string is parsed once; later calls with the same string
+    are a single dict lookup.
     """
+    try:
+        return _BASELINE_CACHE[processing_baseline]
+    except KeyError:
+        pass
+
     try:
         baseline_major = int(processing_baseline.split('.')[0])
     except (ValueError, AttributeError):
         baseline_major = 5  # default to recent baseline
 
-    refl = dn.astype(np.float32)
     if baseline_major >= 4:
-        refl = (refl + BASELINE_OFFSET) / QUANTIFICATION_VALUE
+        converter = _dn_to_reflectance_v4plus
     else:
-        refl = refl / QUANTIFICATION_VALUE
+        converter = _dn_to_reflectance_legacy
+    _BASELINE_CACHE[processing_baseline] = converter
+    return converter
 
-    refl = np.clip(refl, 0.0, None)
-    return refl
+
+def dn_to_reflectance(dn: np.ndarray, processing_baseline: str) -> np.ndarray:
+    """
+    Convert integer DN values to float32 reflectance [0, 1].
+
+    For processing baseline >= 04.00, applies BOA_ADD_OFFSET of -1000.
+    """
+    return get_dn_converter(processing_baseline)(dn)
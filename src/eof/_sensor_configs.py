@@ -5,6 +5,7 @@ band names, native resolutions, DN-to-reflectance conversion,
 cloud masking, and uncertainty estimation.
 """
 
+import functools
 from dataclasses import dataclass
 from typing import Callable, Dict, Tuple, List
 
@@ -20,43 +21,50 @@ from eof._cloud_masks import (
 
 # -----------------------------------------------------------------------
 # DN-to-reflectance conversion functions
+#
+# Each returns (reflectance, valid): a clean scaled float32 array and a
+# bool array of the same shape, False on fill / out-of-range DNs. NaN is
+# written once per item by mask_invalid() after cloud masks are merged.
 # -----------------------------------------------------------------------
 
-def _s2_dn_to_reflectance(dn: np.ndarray, metadata: dict = None) -> np.ndarray:
+def _s2_dn_to_reflectance(dn: np.ndarray, metadata: dict = None) -> tuple:
     """Sentinel-2 DN to reflectance. Handled separately by _scl.py."""
     # This is a placeholder — S2 uses the existing pipeline in _scl.py
     # with processing baseline logic. Called only from the generic path.
     from eof._scl import dn_to_reflectance
     baseline = (metadata or {}).get("processing_baseline", "05.00")
-    return dn_to_reflectance(dn, baseline)
+    # NO_DATA pixels are caught by the SCL mask applied by the caller
+    return dn_to_reflectance(dn, baseline), np.ones(dn.shape, dtype=bool)
 
 
-def _landsat_dn_to_reflectance(dn: np.ndarray, metadata: dict = None) -> np.ndarray:
+def _landsat_dn_to_reflectance(dn: np.ndarray, metadata: dict = None) -> tuple:
     """Landsat Collection 2 Level 2 SR: scale=0.0000275, offset=-0.2."""
-    refl = dn.astype(np.float32) * 0.0000275 - 0.2
-    refl = np.clip(refl, 0.0, None)
-    refl[dn == 0] = np.nan  # fill value
-    return refl
+    valid = dn != 0  # fill value
+    refl = dn.astype(np.float32)
+    np.multiply(refl, np.float32(0.0000275), out=refl)
+    np.subtract(refl, np.float32(0.2), out=refl)
+    np.maximum(refl, np.float32(0.0), out=refl)
+    return refl, valid
 
 
-def _modis_dn_to_reflectance(dn: np.ndarray, metadata: dict = None) -> np.ndarray:
+def _modis_dn_to_reflectance(dn: np.ndarray, metadata: dict = None) -> tuple:
     """MODIS MOD09GA / MOD09A1: scale=0.0001, valid range [-100, 16000]."""
     refl = dn.astype(np.float32) * 0.0001
     refl = np.clip(refl, 0.0, None)
     # Fill value is typically -28672 or 32767
-    refl[(dn < -100) | (dn > 16000)] = np.nan
-    return refl
+    valid = (dn >= -100) & (dn <= 16000)
+    return refl, valid
 
 
-def _viirs_dn_to_reflectance(dn: np.ndarray, metadata: dict = None) -> np.ndarray:
+def _viirs_dn_to_reflectance(dn: np.ndarray, metadata: dict = None) -> tuple:
     """VIIRS VNP09GA: scale=0.0001, valid range [-100, 16000]."""
     refl = dn.astype(np.float32) * 0.0001
     refl = np.clip(refl, 0.0, None)
-    refl[(dn < -100) | (dn > 16000)] = np.nan
-    return refl
+    valid = (dn >= -100) & (dn <= 16000)
+    return refl, valid
 
 
-def _s3_olci_dn_to_reflectance(dn: np.ndarray, metadata: dict = None) -> np.ndarray:
+def _s3_olci_dn_to_reflectance(dn: np.ndarray, metadata: dict = None) -> tuple:
     """Sentinel-3 OLCI: TOA radiance. Simple scaling as placeholder.
 
     GEE provides radiance in W/m2/sr/um. A full conversion would need
@@ -66,9 +74,42 @@ def _s3_olci_dn_to_reflectance(dn: np.ndarray, metadata: dict = None) -> np.ndar
     # GEE OLCI values are already scaled radiances
     # Approximate TOA reflectance: radiance * pi / (solar_irradiance * cos(SZA))
     # For a first approximation, we just use a rough scaling
-    refl = dn.astype(np.float32) * 0.01  # rough scaling
-    refl = np.clip(refl, 0.0, None)
-    return refl
+    refl = dn.astype(np.float32, copy=False)
+    if np.shares_memory(refl, dn):
+        refl = refl.copy()  # never scale the caller's float32 array
+    np.multiply(refl, np.float32(0.01), out=refl)  # rough scaling
+    np.maximum(refl, np.float32(0.0), out=refl)
+    return refl, ~np.isnan(refl)
+
+
+def mask_invalid(reflectance: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """Write NaN into reflectance (in place) wherever valid is False.
+
+    valid may be (B, H, W) or a per-pixel (H, W) mask broadcast over bands.
+    """
+    np.copyto(reflectance, np.nan, where=~valid)
+    return reflectance
+
+
+def all_nan_mask(refs: np.ndarray) -> np.ndarray:
+    """(H, W) mask, True where a (N, B, H, W) stack is NaN for every N and B.
+
+    Reduces one time step at a time, so temporaries are (B, H, W) rather
+    than the full stack. Once every pixel has a valid value the remaining
+    steps are skipped; for cloud-masked stacks that is usually after a
+    handful of dates. When few pixels are still empty only those are checked.
+    """
+    any_valid = np.zeros(refs.shape[2:], dtype=bool)
+    for step in refs:
+        empty = np.flatnonzero(~any_valid)
+        if empty.size == 0:
+            break
+        if empty.size > any_valid.size // 8:
+            any_valid |= ~np.isnan(step).all(axis=0)
+        else:
+            flat = step.reshape(step.shape[0], -1)[:, empty]
+            any_valid.ravel()[empty] = ~np.isnan(flat).all(axis=0)
+    return ~any_valid
 
 
 # -----------------------------------------------------------------------
@@ -77,7 +118,9 @@ def _s3_olci_dn_to_reflectance(dn: np.ndarray, metadata: dict = None) -> np.ndar
 
 def _default_uncertainty(reflectance: np.ndarray) -> np.ndarray:
     """Default uncertainty: 10% of reflectance value."""
-    return np.abs(reflectance) * 0.1
+    unc = np.abs(reflectance)
+    np.multiply(unc, np.float32(0.1), out=unc)
+    return unc
 
 
 # -----------------------------------------------------------------------
@@ -91,7 +134,7 @@ class SensorConfig:
     band_names: tuple                        # output band names
     resolution_groups: Dict[int, List[int]]  # {native_res_m: [band_indices]}
     target_resolution: int                   # output resolution (10m)
-    dn_to_reflectance: Callable              # (dn_array, metadata) -> float32
+    dn_to_reflectance: Callable              # (dn_array, metadata) -> (float32, valid)
     cloud_mask_fn: Callable                  # (qa_array) -> bool mask
     uncertainty_fn: Callable                 # (refl_array) -> unc array
     qa_dtype: type                           # numpy dtype for QA band
@@ -184,6 +227,7 @@ SENSOR_CONFIGS = {
 }
 
 
+@functools.lru_cache(maxsize=32)
 def get_sensor_config(sensor: str) -> SensorConfig:
     """Get the SensorConfig for a named sensor."""
     if sensor not in SENSOR_CONFIGS:
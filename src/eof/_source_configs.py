@@ -1,67 +1,443 @@
 """Source-specific configuration for STAC-based EO data sources."""
 
-from dataclasses import dataclass, field
-from typing import Optional, Callable, List
-from osgeo import gdal
+import functools
+import os
+import sys
+import threading
+import time
+from types import MappingProxyType
+from dataclasses import dataclass, field, replace
+from typing import Optional, Callable, Tuple
 
+from eof._types import _DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class SourceConfig:
-    """Configuration for a STAC-based Sentinel-2 data source."""
+    """Configuration for a STAC-based Sentinel-2 data source.
+
+    configure() applies the source's GDAL options: shared connection and
+    range caching (VSI_CACHE, merged/parallel ranges, no HEAD before GETs,
+    TCP keep-alive), HTTP/2 multiplexing for /vsicurl sources, retries and
+    timeouts, plus any source credentials.
+    """
     name: str
     stac_url: str
     collection: str
-    band_assets: List[str]
+    band_assets: Tuple[str, ...]
     scl_asset_key: str
     max_concurrent_reads: int
     processing_baseline_property: str
-    mgrs_property_keys: List[str]
+    mgrs_property_keys: Tuple[str, ...]
     configure_gdal: Callable
     transform_href: Optional[Callable] = None
     vsi_prefix: str = "/vsicurl"
     s3_endpoint: Optional[str] = None
+    # Warp bands in worker processes instead of threads (opt-in); avoids
+    # GIL and GDAL block-cache contention for decode-heavy (JP2) reads
+    use_process_pool: bool = False
+    # Search with plain HTTP + lightweight items instead of pystac_client
+    use_fast_stac: bool = False
+    # Storage dtype of returned reflectance/uncertainty stacks. Conversion
+    # runs in float32; "float16" halves memory (~1e-3 precision in [0, 1])
+    refl_dtype: str = "float32"
+    # Per-item progress bars; None shows them only on a terminal or in a
+    # notebook, so batch/no-TTY runs skip tqdm entirely
+    show_progress: Optional[bool] = None
+    # Open each file's header on a side pool as soon as its band read is
+    # queued, so the read itself only fetches tiles (thread band pool only)
+    prefetch_headers: bool = False
+    # configure() results by override set, so repeat calls skip replace()
+    _configured: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Asset keys are matched against STAC item dicts for every read;
+        # store them as tuples of interned strings
+        object.__setattr__(self, "band_assets",
+                           tuple(sys.intern(a) for a in self.band_assets))
+        object.__setattr__(self, "mgrs_property_keys",
+                           tuple(sys.intern(k) for k in self.mgrs_property_keys))
+        object.__setattr__(self, "_configured", {})
+        object.__setattr__(self, "scl_asset_key", sys.intern(self.scl_asset_key))
+        object.__setattr__(self, "processing_baseline_property",
+                           sys.intern(self.processing_baseline_property))
+
+    def configure(self, **kwargs) -> "SourceConfig":
+        """Configure GDAL for this source and return the effective config.
+
+        Runtime choices made while configuring (e.g. /vsis3 vs /vsicurl for
+        CDSE) are folded into the returned copy, so readers use plain
+        attributes such as cfg.vsi_prefix rather than an overrides dict.
+
+        configure_gdal itself returns immediately when the source is
+        already live in the calling thread, and the derived config is
+        memoised per override set, so repeat calls are cheap.
+        """
+        overrides = self.configure_gdal(**kwargs)
+        if not overrides:
+            return self
+        key = frozenset(overrides.items())
+        cfg = self._configured.get(key)
+        if cfg is None:
+            if all(getattr(self, k) == v for k, v in overrides.items()):
+                cfg = self
+            else:
+                cfg = replace(self, **overrides)
+            self._configured[key] = cfg
+        return cfg
 
 
 # ---------------------------------------------------------------------------
 # GDAL configuration functions
 # ---------------------------------------------------------------------------
 
-# Keys that vary between sources and must be cleared before each configure
-_SOURCE_SPECIFIC_GDAL_KEYS = [
-    "AWS_NO_SIGN_REQUEST",
-    "AWS_REQUEST_PAYER",
-    "AWS_S3_ENDPOINT",
-    "AWS_ACCESS_KEY_ID",
-    "AWS_SECRET_ACCESS_KEY",
-    "AWS_VIRTUAL_HOSTING",
-    "AWS_HTTPS",
-    "GDAL_HTTP_HEADERS",
-    "GDAL_HTTP_COOKIEFILE",
-    "GDAL_HTTP_COOKIEJAR",
-]
+# Keys that vary between sources and must be cleared before each configure,
+# with the value GDAL uses when the option is not set at all (an
+# environment variable of the same name still takes precedence)
+_SOURCE_SPECIFIC_GDAL_KEYS = {
+    "AWS_NO_SIGN_REQUEST": "NO",
+    "AWS_REQUEST_PAYER": "",
+    "AWS_S3_ENDPOINT": "s3.amazonaws.com",
+    "AWS_ACCESS_KEY_ID": "",
+    "AWS_SECRET_ACCESS_KEY": "",
+    "AWS_VIRTUAL_HOSTING": "TRUE",
+    "AWS_HTTPS": "YES",
+    "GDAL_HTTP_HEADERS": "",
+    "GDAL_HTTP_COOKIEFILE": "",
+    "GDAL_HTTP_COOKIEJAR": "",
+    "GDAL_HTTP_MULTIPLEX": "YES",
+    "GDAL_HTTP_VERSION": "",
+    "GDAL_HTTP_MAX_CACHED_CONNECTIONS": "",
+    "GDAL_HTTP_MAX_TOTAL_CONNECTIONS": "",
+}
+
+
+# Options set from worker threads are thread-local, so readers for
+# different sources can run side by side without seeing each other's
+# endpoints or credentials. The main thread keeps process-global options
+# (the single-source case, and the only option inside a process pool).
+_thread_state = threading.local()
+_global_lock = threading.Lock()
+
+# Only the most recently configured (source, sensor) is live in a given
+# scope (per worker thread, or process-global for the main thread).
+# Re-configuring it is skipped until its credentials expire; switching
+# source always runs the full configure.
+_ACTIVE_SOURCE_KEY = None
+_OVERRIDES_CACHE = {}  # (source, sensor) -> (overrides, monotonic expiry)
+
+# Bearer tokens by source: name -> (token, monotonic expiry)
+_TOKEN_CACHE = {}
+_token_lock = threading.Lock()
+_TOKEN_EXPIRY_MARGIN = 60  # refresh this many seconds before expiry
+
+
+def _in_worker_thread():
+    return threading.current_thread() is not threading.main_thread()
+
+
+def _set_config_option(key, value):
+    """Set a GDAL option for this thread (workers) or the process (main)."""
+    from osgeo import gdal  # deferred so SourceConfig is usable without GDAL
+
+    if _in_worker_thread():
+        gdal.SetThreadLocalConfigOption(key, value)
+    else:
+        gdal.SetConfigOption(key, value)
+
+
+def _set_path_option(prefix, key, value):
+    """Set a GDAL option that only applies to paths under prefix.
+
+    Falls back to a regular (thread/process) option on GDAL < 3.6.
+    """
+    from osgeo import gdal
+
+    if hasattr(gdal, "SetPathSpecificOption"):
+        gdal.SetPathSpecificOption(prefix, key, value)
+    else:
+        _set_config_option(key, value)
+
+
+def _active_key():
+    if _in_worker_thread():
+        return getattr(_thread_state, "active_key", None)
+    return _ACTIVE_SOURCE_KEY
+
+
+def _cached_overrides(key):
+    """Return a copy of the overrides for key if it is still live, else None."""
+    if _active_key() != key:
+        return None
+    overrides, expires = _OVERRIDES_CACHE[key]
+    if time.monotonic() >= expires:
+        return None
+    return dict(overrides)
+
+
+def _mark_configured(key, overrides, expires=float("inf")):
+    """Record key as the live GDAL configuration and return its overrides."""
+    global _ACTIVE_SOURCE_KEY
+    _OVERRIDES_CACHE[key] = (dict(overrides), expires)
+    if _in_worker_thread():
+        _thread_state.active_key = key
+    else:
+        _ACTIVE_SOURCE_KEY = key
+    return overrides
+
+
+def _cached_token(name):
+    """Return a cached bearer token for name, or None if missing/expired."""
+    entry = _TOKEN_CACHE.get(name)
+    if entry is not None and time.monotonic() < entry[1]:
+        return entry[0]
+    return None
+
+
+def _store_token(name, token, expires_in):
+    """Cache token for expires_in seconds (less a safety margin)."""
+    expires = time.monotonic() + max(0, expires_in - _TOKEN_EXPIRY_MARGIN)
+    _TOKEN_CACHE[name] = (token, expires)
+    return expires
+
+
+class _TokenRefresher:
+    """Daemon thread that renews a cached bearer token before it expires.
+
+    Configure calls made after the first one find a fresh token in
+    _TOKEN_CACHE instead of blocking on the token endpoint. on_refresh,
+    if given, re-applies the new token to process-wide GDAL state.
+    """
+
+    RETRY_DELAY = 30
+
+    def __init__(self, name, fetch, on_refresh=None):
+        self.name = name
+        self._fetch = fetch  # () -> (token, expires_in)
+        self._on_refresh = on_refresh
+        self._thread = threading.Thread(
+            target=self._run, name=f"eof-{name}-token-refresh", daemon=True,
+        )
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            entry = _TOKEN_CACHE.get(self.name)
+            # Stored expiry already has a margin; renew one margin earlier
+            delay = entry[1] - time.monotonic() - _TOKEN_EXPIRY_MARGIN if entry else 0
+            time.sleep(max(delay, self.RETRY_DELAY))
+            try:
+                token, expires_in = self._fetch()
+            except Exception:
+                continue  # keep the current token; configure refetches on expiry
+            if not token:
+                continue
+            _store_token(self.name, token, expires_in)
+            if self._on_refresh is not None:
+                self._on_refresh(token)
+
+
+_TOKEN_REFRESHERS = {}
+
+
+def _start_token_refresher(name, fetch, on_refresh=None):
+    """Start the background refresher for name once per process."""
+    if name not in _TOKEN_REFRESHERS:
+        _TOKEN_REFRESHERS[name] = _TokenRefresher(name, fetch, on_refresh)
+
+
+_TOKEN_SESSION = None
+_token_session_lock = threading.Lock()
+
+
+def _token_session():
+    """Shared requests.Session for token endpoints (keeps TLS connections)."""
+    global _TOKEN_SESSION
+    if _TOKEN_SESSION is None:
+        with _token_session_lock:
+            if _TOKEN_SESSION is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                session = requests.Session()
+                session.mount("https://", HTTPAdapter(pool_connections=4,
+                                                      pool_maxsize=16))
+                _TOKEN_SESSION = session
+    return _TOKEN_SESSION
 
 
 def _reset_gdal_source_config():
-    """Clear source-specific GDAL options to prevent leakage between sources."""
+    """Clear source-specific GDAL options to prevent leakage between sources.
+
+    The main thread clears its process-wide options. A worker thread only
+    touches its own thread-local ones: an unset thread-local option falls
+    through to the process-wide value, so each key is pinned to its unset
+    default instead. Whatever the main thread configures, now or later,
+    then never reaches the worker's reads, and the main thread's own
+    configuration (and its configure cache) is left intact.
+    """
+    global _ACTIVE_SOURCE_KEY
+    from osgeo import gdal
+
+    if _in_worker_thread():
+        _thread_state.active_key = None
+        for key, unset in _SOURCE_SPECIFIC_GDAL_KEYS.items():
+            gdal.SetThreadLocalConfigOption(key, os.environ.get(key, unset))
+        return
+    _ACTIVE_SOURCE_KEY = None
     for key in _SOURCE_SPECIFIC_GDAL_KEYS:
         gdal.SetConfigOption(key, None)
 
 
-def _configure_gdal_common():
-    """Set GDAL options common to all sources."""
-    gdal.SetConfigOption("GDAL_DISABLE_READDIR_ON_OPEN", "EMPTY_DIR")
-    gdal.SetConfigOption("CPL_VSIL_CURL_ALLOWED_EXTENSIONS", ".tif,.TIF,.jp2,.xml,.hdf,.h5")
-    gdal.SetConfigOption("GDAL_HTTP_MAX_RETRY", "5")
-    gdal.SetConfigOption("GDAL_HTTP_RETRY_DELAY", "2")
-    gdal.SetConfigOption("GDAL_CACHEMAX", "256")
-    gdal.SetConfigOption("CPL_VSIL_CURL_CACHE_SIZE", "134217728")
-    gdal.SetConfigOption("GDAL_NUM_THREADS", "ALL_CPUS")
-    gdal.SetConfigOption("VSI_CACHE", "TRUE")
-    gdal.SetConfigOption("VSI_CACHE_SIZE", "134217728")
+@functools.lru_cache(maxsize=1)
+def _default_cache_mb():
+    """GDAL block cache size in MB: 25% of physical RAM, clamped to [256, 8192].
+
+    EOF_GDAL_CACHEMAX_MB overrides the computed value.
+    """
+    override = _int_env("EOF_GDAL_CACHEMAX_MB", 0)
+    if override:
+        return override
+    try:
+        ram_mb = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // 2**20
+    except (AttributeError, ValueError, OSError):
+        return 256  # os.sysconf is unavailable on Windows
+    return min(max(ram_mb // 4, 256), 8192)
+
+
+# Static options shared by every source, set process-wide once by
+# _configure_gdal_once (cache sizes are added there)
+_COMMON_GDAL_OPTS = {
+    "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+    "GDAL_HTTP_MAX_RETRY": "5",
+    "GDAL_NUM_THREADS": "ALL_CPUS",
+    "VSI_CACHE": "TRUE",
+    # Fewer, larger GETs for COG tile reads and a smaller header fetch
+    "GDAL_HTTP_MERGE_CONSECUTIVE_RANGES": "YES",
+    # Fetch the ranges of a multi-range read concurrently (SINGLE_GET
+    # would send one multipart request, which S3 does not support)
+    "GDAL_HTTP_MULTIRANGE": "PARALLEL",
+    "CPL_VSIL_CURL_CHUNK_SIZE": "1048576",
+    "GDAL_INGESTED_BYTES_AT_OPEN": "32768",
+    # Fail stalled connects fast
+    "GDAL_HTTP_CONNECTTIMEOUT": "5",
+    "GDAL_HTTP_TIMEOUT": "60",
+    # Keep idle pooled connections alive between items so later band reads
+    # skip the TCP/TLS handshake (GDAL >= 3.6; ignored by older versions)
+    "GDAL_HTTP_TCP_KEEPALIVE": "YES",
+    "GDAL_HTTP_TCP_KEEPIDLE": "30",
+    "GDAL_HTTP_TCP_KEEPINTVL": "15",
+}
+
+# Defaults that some sources override, so they are re-applied on every
+# source switch rather than once
+_PER_SOURCE_GDAL_DEFAULTS = {
+    "GDAL_HTTP_RETRY_DELAY": "2",
+    "GDAL_HTTP_RETRY_CODES": "429,500,502,503,504",
+    # Skip the HEAD before the first ranged GET
+    "CPL_VSIL_CURL_USE_HEAD": "NO",
+}
+
+# File extensions /vsicurl may fetch; sources not listed use the default
+_DEFAULT_ALLOWED_EXTENSIONS = ".tif,.TIF,.jp2,.xml,.hdf,.h5"
+_EXT_OPTS = {
+    "cdse": ".jp2,.xml",          # SAFE granules: JP2 bands + XML metadata
+    "aws": ".tif,.TIF,.xml",      # S2 COGs (.tif), USGS Landsat (.TIF)
+    "planetary": ".tif,.TIF,.xml",
+    "earthdata": ".tif,.TIF,.hdf,.h5",  # HLS COGs and MODIS/VIIRS granules
+}
+
+
+# Processes splitting the GDAL cache budget; spawned band workers set this
+# (via set_gdal_cache_share) so their caches add up to one budget
+_CACHE_SHARERS = 1
+_MIN_SHARED_CACHE_MB = 32
+
+
+def set_gdal_cache_share(n_processes: int):
+    """Size this process's GDAL caches as 1/n_processes of the budget.
+
+    For process-pool initializers; must run before the first configure.
+    """
+    global _CACHE_SHARERS
+    _CACHE_SHARERS = max(1, int(n_processes))
+
+
+@functools.lru_cache(maxsize=1)
+def _configure_gdal_once():
+    """Apply the process-wide GDAL options and size the block cache.
+
+    These never differ between sources, and GDAL reads the cache sizes
+    once per process anyway, so setting them per configure (and per
+    worker thread) only added repeated work. Thread-local source options
+    set later still take precedence.
+    """
+    from osgeo import gdal
+
+    cache_mb = _default_cache_mb()
+    if _CACHE_SHARERS > 1:
+        cache_mb = max(cache_mb // _CACHE_SHARERS, _MIN_SHARED_CACHE_MB)
+    # The curl cache is shared; VSI_CACHE_SIZE applies per open file
+    curl_cache_bytes = cache_mb * 2**20 // 2
+    vsi_cache_bytes = min(curl_cache_bytes, 512 * 2**20)
+    with _global_lock:
+        for key, value in _COMMON_GDAL_OPTS.items():
+            gdal.SetConfigOption(key, value)
+        gdal.SetConfigOption("CPL_VSIL_CURL_CACHE_SIZE", str(curl_cache_bytes))
+        gdal.SetConfigOption("VSI_CACHE_SIZE", str(vsi_cache_bytes))
+        # Resizes the block cache directly, even if it is already in use
+        gdal.SetCacheMax(cache_mb * 2**20)
+
+
+def _apply_common_gdal_opts(source_name):
+    """Set GDAL options common to all sources, plus the source's extensions."""
+    _configure_gdal_once()
+    for key, value in _PER_SOURCE_GDAL_DEFAULTS.items():
+        _set_config_option(key, value)
+    _set_config_option("CPL_VSIL_CURL_ALLOWED_EXTENSIONS",
+                       _EXT_OPTS.get(source_name, _DEFAULT_ALLOWED_EXTENSIONS))
+
+
+def _configure_gdal_http2(max_concurrent_reads):
+    """Multiplex /vsicurl range requests over HTTP/2 with a sized pool."""
+    _set_config_option("GDAL_HTTP_MULTIPLEX", "YES")
+    _set_config_option("GDAL_HTTP_VERSION", "2TLS")
+    _set_config_option("GDAL_HTTP_MAX_CACHED_CONNECTIONS",
+                         str(max(16, max_concurrent_reads * 4)))
+    _set_config_option("GDAL_HTTP_MAX_TOTAL_CONNECTIONS",
+                         str(max(32, max_concurrent_reads * 8)))
+
+
+def _fetch_cdse_token(username, password):
+    """POST for a CDSE access token. Returns (token, expires_in seconds)."""
+    resp = _token_session().post(
+        "https://identity.dataspace.copernicus.eu/auth/realms/CDSE/"
+        "protocol/openid-connect/token",
+        data={
+            "client_id": "cdse-public",
+            "grant_type": "password",
+            "username": username,
+            "password": password,
+        },
+        timeout=30,
+    )
+    resp.raise_for_status()
+    payload = resp.json()
+    return payload["access_token"], payload.get("expires_in", 600)
+
+
+def _apply_cdse_token(token):
+    """Attach the bearer to CDSE URLs only, not every /vsicurl request."""
+    _set_path_option(f"/vsicurl/https://{CDSE_CONFIG.s3_endpoint}/",
+                     "GDAL_HTTP_HEADERS", f"Authorization: Bearer {token}")
 
 
 def _configure_gdal_for_cdse(**kwargs):
     """Configure GDAL for CDSE S3 or token access. Returns runtime overrides."""
+    key = ("cdse", None)
+    cached = _cached_overrides(key)
+    if cached is not None:
+        return cached
+
     _reset_gdal_source_config()
 
     from eof._credentials import get_cdse_credentials
@@ -71,13 +447,14 @@ def _configure_gdal_for_cdse(**kwargs):
     s3_secret = creds["s3_secret_key"]
 
     overrides = {}
+    expires = float("inf")
 
     if s3_key and s3_secret:
-        gdal.SetConfigOption("AWS_S3_ENDPOINT", "eodata.dataspace.copernicus.eu")
-        gdal.SetConfigOption("AWS_ACCESS_KEY_ID", s3_key)
-        gdal.SetConfigOption("AWS_SECRET_ACCESS_KEY", s3_secret)
-        gdal.SetConfigOption("AWS_VIRTUAL_HOSTING", "FALSE")
-        gdal.SetConfigOption("AWS_HTTPS", "YES")
+        _set_config_option("AWS_S3_ENDPOINT", "eodata.dataspace.copernicus.eu")
+        _set_config_option("AWS_ACCESS_KEY_ID", s3_key)
+        _set_config_option("AWS_SECRET_ACCESS_KEY", s3_secret)
+        _set_config_option("AWS_VIRTUAL_HOSTING", "FALSE")
+        _set_config_option("AWS_HTTPS", "YES")
         overrides["vsi_prefix"] = "/vsis3"
     else:
         username = creds["username"]
@@ -89,26 +466,25 @@ def _configure_gdal_for_cdse(**kwargs):
                 "  CDSE_USERNAME + CDSE_PASSWORD\n"
                 "Generate S3 keys at https://eodata.dataspace.copernicus.eu"
             )
-        import requests
-        resp = requests.post(
-            "https://identity.dataspace.copernicus.eu/auth/realms/CDSE/"
-            "protocol/openid-connect/token",
-            data={
-                "client_id": "cdse-public",
-                "grant_type": "password",
-                "username": username,
-                "password": password,
-            },
-            timeout=30,
-        )
-        resp.raise_for_status()
-        token = resp.json()["access_token"]
-        gdal.SetConfigOption("GDAL_HTTP_HEADERS", f"Authorization: Bearer {token}")
+        # One POST for all worker threads configuring at once; later
+        # renewals happen in the background before the token expires
+        with _token_lock:
+            token = _cached_token("cdse")
+            if token is None:
+                fetch = functools.partial(_fetch_cdse_token, username, password)
+                token, expires_in = fetch()
+                _store_token("cdse", token, expires_in)
+                _start_token_refresher("cdse", fetch, _apply_cdse_token)
+        expires = _TOKEN_CACHE["cdse"][1]
+        _apply_cdse_token(token)
         overrides["vsi_prefix"] = "/vsicurl"
 
-    _configure_gdal_common()
-    gdal.SetConfigOption("GDAL_HTTP_RETRY_DELAY", "5")
-    return overrides
+    _apply_common_gdal_opts("cdse")
+    if overrides["vsi_prefix"] == "/vsicurl":
+        _configure_gdal_http2(CDSE_CONFIG.max_concurrent_reads)
+    # Token-authorised URLs can 403 briefly while credentials propagate
+    _set_config_option("GDAL_HTTP_RETRY_CODES", "403,429,500,502,503,504")
+    return _mark_configured(key, overrides, expires)
 
 
 def _configure_gdal_for_aws(**kwargs):
@@ -117,54 +493,114 @@ def _configure_gdal_for_aws(**kwargs):
     Sentinel-2 on AWS is public (no auth needed).
     Landsat on AWS is requester-pays (requires AWS credentials).
     """
-    _reset_gdal_source_config()
-
     sensor = kwargs.get("sensor", "sentinel2")
+    key = ("aws", sensor)
+    cached = _cached_overrides(key)
+    if cached is not None:
+        return cached
+
+    _reset_gdal_source_config()
 
     overrides = {}
 
     if sensor == "landsat":
         # USGS Landsat bucket is requester-pays — needs AWS credentials + /vsis3
-        gdal.SetConfigOption("AWS_REQUEST_PAYER", "requester")
+        _set_config_option("AWS_REQUEST_PAYER", "requester")
         overrides["vsi_prefix"] = "/vsis3"
     else:
         # Sentinel-2 on AWS is public
-        gdal.SetConfigOption("AWS_NO_SIGN_REQUEST", "YES")
+        _set_config_option("AWS_NO_SIGN_REQUEST", "YES")
 
-    _configure_gdal_common()
-    return overrides
+    _apply_common_gdal_opts("aws")
+    if overrides.get("vsi_prefix", "/vsicurl") == "/vsicurl":
+        _configure_gdal_http2(AWS_CONFIG.max_concurrent_reads)
+    return _mark_configured(key, overrides)
 
 
 def _configure_gdal_for_planetary(**kwargs):
     """Configure GDAL for Planetary Computer signed URL access."""
+    key = ("planetary", None)
+    cached = _cached_overrides(key)
+    if cached is not None:
+        return cached
+
     _reset_gdal_source_config()
-    _configure_gdal_common()
-    return {}
+    _apply_common_gdal_opts("planetary")
+    # SAS-signed blob URLs rely on HEAD for the object size
+    _set_config_option("CPL_VSIL_CURL_USE_HEAD", "YES")
+    _configure_gdal_http2(PLANETARY_CONFIG.max_concurrent_reads)
+    return _mark_configured(key, {})
+
+
+# Container-scoped SAS tokens: (account, container) -> (token, monotonic expiry)
+_SAS_TOKEN_CACHE = {}
+_SAS_DEFAULT_TTL = 3600
+
+
+def _planetary_container_token(account, container):
+    """Return a cached SAS token for an Azure container, refreshing on expiry."""
+    entry = _SAS_TOKEN_CACHE.get((account, container))
+    if entry is not None and time.monotonic() < entry[1]:
+        return entry[0]
+
+    from datetime import datetime, timezone
+    from planetary_computer.sas import get_token
+
+    sas = get_token(account, container)
+    expiry = getattr(sas, "expiry", None)
+    if expiry is not None:
+        ttl = (expiry - datetime.now(timezone.utc)).total_seconds()
+    else:
+        ttl = _SAS_DEFAULT_TTL
+    expires = time.monotonic() + max(0, ttl - _TOKEN_EXPIRY_MARGIN)
+    _SAS_TOKEN_CACHE[(account, container)] = (sas.token, expires)
+    return sas.token
 
 
 def _planetary_sign_href(href):
-    """Sign an Azure Blob Storage URL using planetary_computer."""
+    """Sign an Azure Blob Storage URL using planetary_computer.
+
+    Blob URLs are signed locally with a cached per-container SAS token, so
+    only the first asset from each container needs a token request.
+    """
     try:
         import planetary_computer
-        return planetary_computer.sign_url(href)
     except ImportError:
         return href
 
+    from urllib.parse import urlsplit
+    parts = urlsplit(href)
+    if not parts.netloc.endswith(".blob.core.windows.net") or parts.query:
+        return planetary_computer.sign_url(href)
+
+    account = parts.netloc.split(".", 1)[0]
+    container = parts.path.lstrip("/").split("/", 1)[0]
+    return f"{href}?{_planetary_container_token(account, container)}"
+
 
 # ---------------------------------------------------------------------------
 # Pre-built source configurations
 # ---------------------------------------------------------------------------
 
+def _int_env(name, default):
+    """Read a positive integer from the environment, falling back to default."""
+    try:
+        value = int(os.environ.get(name, default))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
 CDSE_CONFIG = SourceConfig(
     name="cdse",
     stac_url="https://stac.dataspace.copernicus.eu/v1",
     collection="sentinel-2-l2a",
-    band_assets=['B02_10m', 'B03_10m', 'B04_10m', 'B05_20m', 'B06_20m',
-                 'B07_20m', 'B08_10m', 'B8A_20m', 'B11_20m', 'B12_20m'],
+    band_assets=('B02_10m', 'B03_10m', 'B04_10m', 'B05_20m', 'B06_20m',
+                 'B07_20m', 'B08_10m', 'B8A_20m', 'B11_20m', 'B12_20m'),
     scl_asset_key='SCL_20m',
-    max_concurrent_reads=4,
+    max_concurrent_reads=_int_env("EOF_MAX_CONCURRENT_READS_CDSE", 16),
     processing_baseline_property='processing:version',
-    mgrs_property_keys=['grid:code'],
+    mgrs_property_keys=('grid:code',),
     configure_gdal=_configure_gdal_for_cdse,
     vsi_prefix="/vsis3",
     s3_endpoint="eodata.dataspace.copernicus.eu",
@@ -174,12 +610,12 @@ AWS_CONFIG = SourceConfig(
     name="aws",
     stac_url="https://earth-search.aws.element84.com/v1",
     collection="sentinel-2-l2a",
-    band_assets=['blue', 'green', 'red', 'rededge1', 'rededge2', 'rededge3',
-                 'nir', 'nir08', 'swir16', 'swir22'],
+    band_assets=('blue', 'green', 'red', 'rededge1', 'rededge2', 'rededge3',
+                 'nir', 'nir08', 'swir16', 'swir22'),
     scl_asset_key='scl',
-    max_concurrent_reads=8,
+    max_concurrent_reads=_int_env("EOF_MAX_CONCURRENT_READS_AWS", 16),
     processing_baseline_property='s2:processing_baseline',
-    mgrs_property_keys=['grid:code', 'mgrs:grid_square', 's2:mgrs_tile'],
+    mgrs_property_keys=('grid:code', 'mgrs:grid_square', 's2:mgrs_tile'),
     configure_gdal=_configure_gdal_for_aws,
 )
 
@@ -187,15 +623,29 @@ PLANETARY_CONFIG = SourceConfig(
     name="planetary",
     stac_url="https://planetarycomputer.microsoft.com/api/stac/v1",
     collection="sentinel-2-l2a",
-    band_assets=['B02', 'B03', 'B04', 'B05', 'B06', 'B07', 'B08', 'B8A', 'B11', 'B12'],
+    band_assets=('B02', 'B03', 'B04', 'B05', 'B06', 'B07', 'B08', 'B8A', 'B11', 'B12'),
     scl_asset_key='SCL',
-    max_concurrent_reads=8,
+    max_concurrent_reads=_int_env("EOF_MAX_CONCURRENT_READS_PLANETARY", 16),
     processing_baseline_property='s2:processing_baseline',
-    mgrs_property_keys=['grid:code', 's2:mgrs_tile'],
+    mgrs_property_keys=('grid:code', 's2:mgrs_tile'),
     configure_gdal=_configure_gdal_for_planetary,
     transform_href=_planetary_sign_href,
 )
 
+def _fetch_earthdata_token(username, password):
+    """Fetch an Earthdata Login bearer token. Returns (token, expires_in)."""
+    import base64
+    auth_str = base64.b64encode(f"{username}:{password}".encode()).decode()
+    resp = _token_session().post(
+        "https://urs.earthdata.nasa.gov/api/users/find_or_create_token",
+        headers={"Authorization": f"Basic {auth_str}"},
+        timeout=30,
+    )
+    resp.raise_for_status()
+    # EDL user tokens are long-lived; refetch hourly anyway
+    return resp.json().get("access_token", ""), 3600
+
+
 def _configure_gdal_for_earthdata(**kwargs):
     """Configure GDAL for NASA Earthdata access via bearer token or .netrc.
 
@@ -207,14 +657,19 @@ def _configure_gdal_for_earthdata(**kwargs):
 
     Returns runtime overrides dict.
     """
+    key = ("earthdata", None)
+    cached = _cached_overrides(key)
+    if cached is not None:
+        return cached
+
     _reset_gdal_source_config()
 
     import os
 
     overrides = {}
 
-    # Try bearer token from env first
-    token = os.environ.get("EARTHDATA_TOKEN", "")
+    # Try bearer token from env first, then one fetched earlier
+    token = os.environ.get("EARTHDATA_TOKEN", "") or _cached_token("earthdata")
 
     if not token:
         # Try to get credentials and fetch a token
@@ -224,62 +679,81 @@ def _configure_gdal_for_earthdata(**kwargs):
         password = creds.get("password", "")
 
         if username and password:
-            import base64
-            import requests
-            auth_str = base64.b64encode(
-                f"{username}:{password}".encode()
-            ).decode()
+            fetch = functools.partial(_fetch_earthdata_token, username, password)
             try:
-                resp = requests.post(
-                    "https://urs.earthdata.nasa.gov/api/users/find_or_create_token",
-                    headers={"Authorization": f"Basic {auth_str}"},
-                    timeout=30,
-                )
-                resp.raise_for_status()
-                token = resp.json().get("access_token", "")
+                # Threads that waited on the lock reuse the token the
+                # first one fetched instead of logging in again
+                with _token_lock:
+                    token = _cached_token("earthdata")
+                    if token is None:
+                        token, expires_in = fetch()
+                        if token:
+                            _store_token("earthdata", token, expires_in)
+                            _start_token_refresher("earthdata", fetch)
             except Exception:
                 # Fall back to cookie-based auth via .netrc
                 pass
 
+    expires = float("inf")
     if token:
-        gdal.SetConfigOption("GDAL_HTTP_HEADERS",
+        _set_config_option("GDAL_HTTP_HEADERS",
                              f"Authorization: Bearer {token}")
+        entry = _TOKEN_CACHE.get("earthdata")
+        if entry is not None and entry[0] == token:
+            # The header is not path-scoped, so a refreshed token cannot be
+            # pushed into each thread; reconfigure once this one expires
+            expires = entry[1]
     else:
         # Rely on .netrc for cookie-based auth
         cookie_file = os.path.expanduser("~/.eof/earthdata_cookies.txt")
-        gdal.SetConfigOption("GDAL_HTTP_COOKIEFILE", cookie_file)
-        gdal.SetConfigOption("GDAL_HTTP_COOKIEJAR", cookie_file)
+        _set_config_option("GDAL_HTTP_COOKIEFILE", cookie_file)
+        _set_config_option("GDAL_HTTP_COOKIEJAR", cookie_file)
 
-    _configure_gdal_common()
-    gdal.SetConfigOption("GDAL_HTTP_RETRY_DELAY", "5")
-    return overrides
+    _apply_common_gdal_opts("earthdata")
+    _configure_gdal_http2(EARTHDATA_CONFIG.max_concurrent_reads)
+    _set_config_option("GDAL_HTTP_RETRY_DELAY", "5")
+    _set_config_option("GDAL_HTTP_RETRY_CODES", "403,429,500,502,503,504")
+    return _mark_configured(key, overrides, expires)
 
 
 EARTHDATA_CONFIG = SourceConfig(
     name="earthdata",
     stac_url="https://cmr.earthdata.nasa.gov/stac/LPCLOUD",
     collection="HLSL30_2.0",  # default; overridden per sensor by bindings
-    band_assets=[],  # overridden per sensor
+    band_assets=(),  # overridden per sensor
     scl_asset_key="Fmask",
-    max_concurrent_reads=4,
+    max_concurrent_reads=_int_env("EOF_MAX_CONCURRENT_READS_EARTHDATA", 8),
     processing_baseline_property="",
-    mgrs_property_keys=[],
+    mgrs_property_keys=(),
     configure_gdal=_configure_gdal_for_earthdata,
 )
 
 
-SOURCE_CONFIGS = {
+# Read-only registry; the string keys are compile-time constants and so
+# already interned
+SOURCE_CONFIGS = MappingProxyType({
     "cdse": CDSE_CONFIG,
     "aws": AWS_CONFIG,
     "planetary": PLANETARY_CONFIG,
     "earthdata": EARTHDATA_CONFIG,
-}
+})
+
+
+def configure_gdal_for_thread(source, **kwargs) -> SourceConfig:
+    """Apply a source's GDAL options in the calling thread.
+
+    Use as a thread-pool initializer so every worker reading from the
+    source carries its own options. source may be a name or a SourceConfig.
+    """
+    cfg = get_config(source) if isinstance(source, str) else source
+    return cfg.configure(**kwargs)
 
 
 def get_config(source: str) -> SourceConfig:
     """Get the SourceConfig for a named data source."""
-    if source not in SOURCE_CONFIGS:
+    cfg = SOURCE_CONFIGS.get(source)
+    if cfg is None:
         raise ValueError(
             f"Unknown source '{source}'. Available: {list(SOURCE_CONFIGS.keys())}"
         )
-    return SOURCE_CONFIGS[source]
+    return cfg
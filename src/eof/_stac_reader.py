@@ -5,42 +5,339 @@ single implementation parameterized by SourceConfig. Supports Sentinel-2
 (original API) and generic multi-sensor fetch via fetch_sensor().
 """
 
+import atexit
 import os
-import json
+import sys
 import tempfile
 import threading
+import multiprocessing
+from datetime import datetime
 import numpy as np
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import ChainMap
+from concurrent.futures import (
+    Future, ThreadPoolExecutor, ProcessPoolExecutor, as_completed,
+)
 from functools import partial
-from tqdm.auto import tqdm
-from osgeo import gdal
-import shapely
-import mgrs
-import pystac_client
+from shapely.geometry import mapping
 
 from eof._types import S2Result, EOResult
-from eof._source_configs import SourceConfig
-from eof._sensor_configs import SensorConfig
+from eof._source_configs import (
+    SourceConfig, configure_gdal_for_thread, set_gdal_cache_share,
+)
+from eof._sensor_configs import SensorConfig, mask_invalid
 from eof._platform_bindings import SensorPlatformBinding
-from eof._geojson import load_geojson
-from eof._cache import get_cache_path, save_to_cache, load_from_cache
-from eof._scl import apply_scl_cloud_mask, dn_to_reflectance
-from eof._gdal_io import read_and_crop_band
+from eof._dates import day_of_year
+from eof._geojson import load_geojson, mgrs_tile
+from eof._cache import (
+    cache_exists, get_cache_path, save_to_cache, load_from_cache,
+    search_cache_path, load_search_cache, save_search_cache,
+)
+from eof._scl import apply_scl_cloud_mask, scl_cloud_mask, dn_to_reflectance
+from eof._gdal_io import (
+    read_and_crop_band, build_vsi_path, open_header, quiet_gdal, warp_band,
+)
+from eof._stac_search import RawItem, prefetch, search_items
 from eof._footprints import compute_all_footprints
 from eof._bandpass import load_srf
 
-gdal.PushErrorHandler('CPLQuietErrorHandler')
+
+def _progress_enabled(show_progress) -> bool:
+    """Resolve SourceConfig.show_progress; None means terminal or notebook."""
+    if show_progress is not None:
+        return show_progress
+    if "ipykernel" in sys.modules:
+        return True
+    stderr = sys.stderr
+    return stderr is not None and stderr.isatty()
+
+
+def _progress_bar(iterable, **kwargs):
+    """tqdm bar over iterable. tqdm is imported only when a bar is shown,
+    and the notebook widget only inside an already-running kernel."""
+    if "ipykernel" in sys.modules:
+        try:
+            from tqdm.notebook import tqdm
+            return tqdm(iterable, **kwargs)
+        except ImportError:  # ipywidgets not installed
+            pass
+    from tqdm import tqdm
+    return tqdm(iterable, **kwargs)
+
+
+def _item_sort_key(item):
+    """Sort key by acquisition time (some items, e.g. MODIS, only carry
+    start_datetime)."""
+    return item.datetime or item.properties.get("start_datetime", "9999")
+
+
+def _run_now(fn, *args) -> Future:
+    """Call fn in this thread, returning its outcome as a finished Future."""
+    future = Future()
+    try:
+        future.set_result(fn(*args))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+class _FailureWatch:
+    """Counts item outcomes for one fetch, from submission to collection.
+
+    More than max(3, n // 10) failures among the n items submitted, with
+    no success, means the configuration is likely broken (bad credentials,
+    unreachable host). broken is then set: _submit_streamed stops feeding
+    the search to the pool and _collect_results stops waiting, both by
+    raising error().
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._recorded = set()
+        self.n_items = self.n_ok = self.n_failed = 0
+        self.errors = []
+        self.broken = threading.Event()
+
+    def watch(self, future: Future, item_id: str):
+        with self._lock:
+            self.n_items += 1
+        future.add_done_callback(partial(self.record, item_id))
+
+    def record(self, item_id: str, future: Future):
+        """Count a finished future once, from its callback or a collector."""
+        if future.cancelled():
+            return
+        e = future.exception()
+        with self._lock:
+            if future in self._recorded:
+                return
+            self._recorded.add(future)
+            if e is None:
+                self.n_ok += 1
+                return
+            self.n_failed += 1
+            if len(self.errors) < 3:
+                self.errors.append(f"{item_id}: {e}")
+            if not self.n_ok and self.n_failed > max(3, self.n_items // 10):
+                self.broken.set()
+
+    def error(self) -> RuntimeError:
+        with self._lock:
+            return RuntimeError(
+                f"Aborted after the first {self.n_failed} of {self.n_items} "
+                f"items failed; first errors:\n  " + "\n  ".join(self.errors)
+            )
+
+
+def _discard_inflight(pending: dict, lock, key, future):
+    """Done-callback: forget a finished read so later reads start afresh."""
+    with lock:
+        if pending.get(key) is future:
+            del pending[key]
+
+
+def _init_band_process(n_workers: int):
+    """Process-pool initializer: silence GDAL and take 1/n_workers of the
+    GDAL cache budget, which is sized for a single process."""
+    quiet_gdal()
+    set_gdal_cache_share(n_workers)
+
+
+def _run_configured(configure, fn, *args, **kwargs):
+    """Apply the source's GDAL options in this pool thread, then call fn."""
+    configure()
+    return fn(*args, **kwargs)
+
+
+class _ConfiguredExecutor:
+    """Submit-only view of a shared band pool for one source/sensor.
+
+    Band pools outlive a single fetch, so each task re-applies its GDAL
+    options (a no-op when the thread is already configured for them)
+    rather than relying on a one-off pool initializer. read_kwargs (as for
+    read_and_crop_band) are fixed for the whole fetch and bound once here.
+
+    inflight is an optional (dict, RLock) shared by the reader's executors:
+    a read identical to one still running (same asset, cutline and output
+    grid) attaches to its Future instead of fetching the ranges again.
+
+    With a header_pool, each queued read also gets its file's header
+    opened there, so by the time a band worker picks the read up GDAL's
+    caches already hold the header and only tile ranges are fetched.
+    """
+
+    def __init__(self, executor: ThreadPoolExecutor, configure,
+                 read_kwargs: dict = None, inflight: tuple = None,
+                 header_pool: ThreadPoolExecutor = None):
+        self._executor = executor
+        self._configure = configure
+        read_kwargs = read_kwargs or {}
+        self._read_fn = partial(read_and_crop_band, **read_kwargs)
+        self._header_pool = header_pool
+        if header_pool is not None:
+            self._vsi_path = partial(
+                build_vsi_path,
+                vsi_prefix=read_kwargs.get("vsi_prefix", "/vsicurl"),
+                transform_href=read_kwargs.get("transform_href"),
+                s3_endpoint=read_kwargs.get("s3_endpoint"),
+            )
+        self._inflight = inflight
+        self._read_key = (read_kwargs.get("geojson_cutline"),
+                          read_kwargs.get("target_resolution", 10),
+                          read_kwargs.get("vsi_prefix"))
+
+    def submit(self, fn, *args, **kwargs):
+        return self._executor.submit(
+            _run_configured, self._configure, fn, *args, **kwargs,
+        )
+
+    def read(self, href, resample_alg, data_type):
+        """Submit one band read, or join an identical one in flight."""
+        if self._inflight is None:
+            return self._submit_read(href, resample_alg, data_type)
+        pending, lock = self._inflight
+        key = (href, resample_alg, data_type) + self._read_key
+        with lock:
+            future = pending.get(key)
+            if future is None:
+                future = self._submit_read(href, resample_alg, data_type)
+                pending[key] = future
+                # Runs at once if the read already finished; lock is an RLock
+                future.add_done_callback(
+                    partial(_discard_inflight, pending, lock, key))
+        return future
+
+    def _submit_read(self, href, resample_alg, data_type):
+        if self._header_pool is not None:
+            self._header_pool.submit(_run_configured, self._configure,
+                                     open_header, self._vsi_path(href))
+        return self.submit(self._read_fn, href, resample_alg=resample_alg,
+                           data_type=data_type)
+
+
+class _ProcessBandExecutor(_ConfiguredExecutor):
+    """Band reads on a process pool.
+
+    hrefs are resolved (and signed) in the parent and workers receive only
+    picklable warp arguments. Each worker is a separate process: it
+    applies the source's GDAL options itself, with its own token cache.
+    Workers silence GDAL's error output when they start and size their
+    GDAL caches to an equal share of the single-process budget.
+    """
+
+    def __init__(self, executor: ProcessPoolExecutor, configure,
+                 read_kwargs: dict = None, inflight: tuple = None):
+        super().__init__(executor, configure, read_kwargs, inflight)
+        kw = read_kwargs or {}
+        self._vsi_args = (kw["vsi_prefix"], kw.get("transform_href"),
+                          kw.get("s3_endpoint"))
+        self._warp_args = (kw["geojson_cutline"],
+                           kw.get("target_resolution", 10))
+        self._num_threads = kw.get("num_threads")
+
+    def _submit_read(self, href, resample_alg, data_type):
+        vsi_path = build_vsi_path(href, *self._vsi_args)
+        return self.submit(warp_band, vsi_path, *self._warp_args,
+                           resample_alg, data_type, self._num_threads)
 
 
 class STACReader:
-    """Fetch Sentinel-2 L2A data via STAC API, parameterized by SourceConfig."""
+    """Fetch Sentinel-2 L2A data via STAC API, parameterized by SourceConfig.
+
+    Thread pools are created on first fetch and reused across calls; use
+    the reader as a context manager (or call close()) to shut them down.
+    With config.use_process_pool, band warps run in a spawned process pool.
+    """
 
     def __init__(self, config: SourceConfig):
         self.config = config
-        self._semaphore = threading.Semaphore(config.max_concurrent_reads)
+        self._client = None
+        self._stac_session = None
+        self._pool_lock = threading.Lock()
+        self._item_pool = None
+        self._band_pool = None
+        self._header_pool = None
+        # Band reads in flight across items and fetches, for deduplication
+        self._inflight = ({}, threading.RLock())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        self.close(wait=False)
+
+    def close(self, wait: bool = True):
+        """Shut down the reader's thread pools and STAC session."""
+        pools = (getattr(self, "_item_pool", None),
+                 getattr(self, "_band_pool", None),
+                 getattr(self, "_header_pool", None))
+        self._item_pool = self._band_pool = self._header_pool = None
+        if getattr(self, "_client", None) is not None:
+            self.invalidate()
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown(wait=wait)
+
+    def _pools(self):
+        """Return (item_pool, band_pool), creating them on first use.
+
+        Items are bounded by max_concurrent_reads. Item tasks block on
+        their band futures, so bands need their own pool: sharing one pool
+        could fill every worker with waiting items and deadlock.
+        """
+        with self._pool_lock:
+            if self._band_pool is None:
+                quiet_gdal()
+                n = self.config.max_concurrent_reads
+                self._item_pool = ThreadPoolExecutor(
+                    max_workers=n, thread_name_prefix=f"eof-{self.config.name}-item",
+                )
+                if self.config.use_process_pool:
+                    self._band_pool = ProcessPoolExecutor(
+                        max_workers=n,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_init_band_process,
+                        initargs=(n,),
+                    )
+                else:
+                    # The pool size is the only cap on concurrent GDAL reads
+                    self._band_pool = ThreadPoolExecutor(
+                        max_workers=n,
+                        thread_name_prefix=f"eof-{self.config.name}-band",
+                    )
+                    if self.config.prefetch_headers:
+                        self._header_pool = ThreadPoolExecutor(
+                            max_workers=2 * n,
+                            thread_name_prefix=f"eof-{self.config.name}-header",
+                        )
+            return self._item_pool, self._band_pool
+
+    def _band_executor(self, band_pool, cfg: SourceConfig, sensor: str,
+                       **read_kwargs):
+        """Wrap the band pool so each read runs with cfg's GDAL options.
+
+        read_kwargs are the per-fetch read_and_crop_band arguments
+        (geojson_cutline, vsi_prefix, ...); source-level ones are added here.
+        """
+        configure = partial(configure_gdal_for_thread, cfg, sensor=sensor)
+        read_kwargs.update(
+            transform_href=cfg.transform_href,
+            s3_endpoint=cfg.s3_endpoint,
+            # Up to max_concurrent_reads reads run at once; each gets an
+            # equal share of the CPUs for GDAL's own threads
+            num_threads=max(1, (os.cpu_count() or 1) // cfg.max_concurrent_reads),
+        )
+        if isinstance(band_pool, ProcessPoolExecutor):
+            return _ProcessBandExecutor(band_pool, configure, read_kwargs,
+                                        self._inflight)
+        return _ConfiguredExecutor(band_pool, configure, read_kwargs,
+                                   self._inflight, self._header_pool)
 
     def fetch(self, start_date: str, end_date: str, geojson_path: str,
-              data_folder: str = None, max_cloud_cover: int = 80) -> S2Result:
+              data_folder: str = None, max_cloud_cover: int = 80,
+              refresh_search: bool = False) -> S2Result:
         """
         Fetch Sentinel-2 L2A data for a field boundary.
 
@@ -50,15 +347,15 @@ class STACReader:
             geojson_path: Path to GeoJSON field boundary.
             data_folder: Cache directory. None creates a temp dir.
             max_cloud_cover: Max cloud cover percentage.
+            refresh_search: Re-run the STAC search even if data_folder holds
+                a cached result for it, and replace that result.
 
         Returns:
             S2Result with reflectance, uncertainty, angles, doys, mask, geotransform, crs.
         """
-        cfg = self.config
-
         # Configure GDAL
-        overrides = cfg.configure_gdal(sensor="sentinel2")
-        vsi_prefix = overrides.get("vsi_prefix", cfg.vsi_prefix)
+        cfg = self.config.configure(sensor="sentinel2")
+        vsi_prefix = cfg.vsi_prefix
 
         # Set up data folder
         if data_folder is None:
@@ -69,14 +366,33 @@ class STACReader:
         # Load geometry
         geometry = load_geojson(geojson_path)
         centroid = geometry.centroid
-        geojson_dict = json.loads(shapely.to_geojson(geometry))
-
-        # STAC search
-        items = self._search(geojson_dict, start_date, end_date, max_cloud_cover)
-        print(f"STAC search ({cfg.name}): {len(items)} items found")
-
-        # Filter to single MGRS tile
-        items = self._filter_mgrs(items, centroid.x, centroid.y)
+        geojson_dict = mapping(geometry)
+
+        # Items on the field's MGRS tile start processing as search pages
+        # arrive; the remaining pages are fetched while they read.
+        item_executor, band_pool = self._pools()
+        # Band readers carry their own (thread-local) GDAL source options
+        band_executor = self._band_executor(
+            band_pool, cfg, "sentinel2",
+            geojson_cutline=geojson_path, vsi_prefix=vsi_prefix,
+        )
+        process_with_bands = partial(
+            self._process_item,
+            geojson_cutline=geojson_path,
+            vsi_prefix=vsi_prefix,
+            data_folder=data_folder,
+            band_executor=band_executor,
+        )
+        items, future_to_idx, n_found, n_cached, failures = self._submit_streamed(
+            self._search(geojson_dict, start_date, end_date, max_cloud_cover,
+                         data_folder=data_folder, refresh=refresh_search),
+            partial(item_executor.submit, process_with_bands),
+            keep=self._mgrs_filter(centroid.x, centroid.y),
+            cache_path=lambda item: get_cache_path(item.id, data_folder),
+            process_cached=process_with_bands,
+            max_pending=2 * cfg.max_concurrent_reads,
+        )
+        print(f"STAC search ({cfg.name}): {n_found} items found")
 
         if not items:
             raise RuntimeError(
@@ -93,90 +409,31 @@ class STACReader:
                 break
         print(f"Filtered to {len(items)} items on tile {tile_code}")
 
-        # Sort by datetime
-        items.sort(key=lambda x: x.datetime)
+        # Extract angles and DOYs (items are already in datetime order)
+        s2_angles = np.empty((3, len(items)), dtype=np.float32)
+        doys = np.empty(len(items), dtype=np.int64)
+        extract_angles = self._angle_extractor(items[0])
+        for i, item in enumerate(items):
+            s2_angles[:, i] = extract_angles(item)
+            doys[i] = day_of_year(item.datetime)
 
-        # Extract angles and DOYs
-        szas, vzas, raas, doys = [], [], [], []
-        for item in items:
-            sza, vza, raa = self._extract_angles(item)
-            szas.append(sza)
-            vzas.append(vza)
-            raas.append(raa)
-            doys.append(item.datetime.timetuple().tm_yday)
-
-        s2_angles = np.array([szas, vzas, raas], dtype=np.float64)
-        doys = np.array(doys, dtype=np.int64)
-
-        # Cache status
-        n_cached = sum(
-            1 for item in items
-            if os.path.exists(get_cache_path(item.id, data_folder))
-        )
         print(f"Cache: {n_cached}/{len(items)} items cached, "
               f"{len(items) - n_cached} to download")
 
-        # Process items with two-level executor
-        band_pool_size = cfg.max_concurrent_reads + 4
-        process_fn = partial(
-            self._process_item,
-            geojson_cutline=geojson_path,
-            vsi_prefix=vsi_prefix,
-            data_folder=data_folder,
+        s2_refs, ok, mask, geotransform, crs = self._collect_results(
+            future_to_idx, items, desc=f"Processing S2 items ({cfg.name})",
+            dtype=cfg.refl_dtype, failures=failures,
         )
-
-        failed_items = []
-        with ThreadPoolExecutor(max_workers=band_pool_size) as band_executor:
-            process_with_bands = partial(process_fn, band_executor=band_executor)
-            with ThreadPoolExecutor(max_workers=len(items)) as item_executor:
-                future_to_idx = {
-                    item_executor.submit(process_with_bands, item): i
-                    for i, item in enumerate(items)
-                }
-                results = [None] * len(items)
-                for future in tqdm(
-                    as_completed(future_to_idx),
-                    total=len(items),
-                    desc=f"Processing S2 items ({cfg.name})",
-                    unit="item",
-                ):
-                    idx = future_to_idx[future]
-                    try:
-                        results[idx] = future.result()
-                    except Exception as e:
-                        item_id = items[idx].id
-                        print(f"\nWarning: failed to process {item_id}: {e}")
-                        failed_items.append(idx)
-
-        if failed_items:
-            print(f"Skipped {len(failed_items)}/{len(items)} items due to errors")
-
-        # Assemble output (skip failed items)
-        s2_reflectances = []
-        valid_indices = []
-        geotransform = None
-        crs = None
-        for i, result_item in enumerate(results):
-            if result_item is None:
-                continue
-            refl, gt, proj = result_item
-            s2_reflectances.append(refl)
-            valid_indices.append(i)
-            if geotransform is None:
-                geotransform = gt
-                crs = proj
-
-        if not s2_reflectances:
+        if s2_refs is None:
             raise RuntimeError(
                 f"All {len(items)} S2 items failed to download."
             )
 
-        s2_angles = s2_angles[:, valid_indices]
-        doys = doys[valid_indices]
+        s2_angles = s2_angles[:, ok]
+        doys = doys[ok]
 
-        s2_refs = np.array(s2_reflectances, dtype=np.float32)
-        s2_uncs = np.abs(s2_refs) * 0.1
-        mask = np.all(np.isnan(s2_refs), axis=(0, 1))
+        # 10% of reflectance; the DN converters clamp at 0, so no abs pass
+        s2_uncs = np.multiply(s2_refs, np.float32(0.1), dtype=s2_refs.dtype)
 
         return S2Result(
             reflectance=s2_refs,
@@ -192,7 +449,8 @@ class STACReader:
                      binding: SensorPlatformBinding,
                      start_date: str, end_date: str, geojson_path: str,
                      data_folder: str = None,
-                     max_cloud_cover: int = 80) -> EOResult:
+                     max_cloud_cover: int = 80,
+                     refresh_search: bool = False) -> EOResult:
         """
         Fetch multi-sensor EO data via STAC API.
 
@@ -204,16 +462,17 @@ class STACReader:
             geojson_path: Path to GeoJSON field boundary.
             data_folder: Cache directory. None creates a temp dir.
             max_cloud_cover: Max cloud cover percentage.
+            refresh_search: Re-run the STAC search even if data_folder holds
+                a cached result for it, and replace that result.
 
         Returns:
             EOResult with reflectance, footprints, etc.
         """
-        cfg = self.config
         sensor = sensor_config.name
 
         # Configure GDAL (pass sensor for source-specific setup, e.g. AWS requester-pays)
-        overrides = cfg.configure_gdal(sensor=sensor)
-        vsi_prefix = overrides.get("vsi_prefix", cfg.vsi_prefix)
+        cfg = self.config.configure(sensor=sensor)
+        vsi_prefix = cfg.vsi_prefix
 
         # Set up data folder
         if data_folder is None:
@@ -223,27 +482,48 @@ class STACReader:
 
         # Load geometry
         geometry = load_geojson(geojson_path)
-        geojson_dict = json.loads(shapely.to_geojson(geometry))
+        geojson_dict = mapping(geometry)
 
         # STAC search — some sensors (MODIS, VIIRS, OLCI) don't have eo:cloud_cover
         has_cloud_cover = sensor in ("sentinel2", "landsat")
-        items = self._search_collection(
+        search = self._search_collection(
             binding.collection, geojson_dict, start_date, end_date,
             max_cloud_cover, extra_query=binding.extra_query or None,
-            has_cloud_cover=has_cloud_cover,
+            has_cloud_cover=has_cloud_cover, data_folder=data_folder,
+            refresh=refresh_search,
         )
 
-        # Filter out items that don't have the required band assets
+        # Items start processing as search pages arrive
+        item_executor, band_pool = self._pools()
+        # Band readers carry their own (thread-local) GDAL source options
+        band_executor = self._band_executor(
+            band_pool, cfg, sensor,
+            geojson_cutline=geojson_path, vsi_prefix=vsi_prefix,
+            target_resolution=sensor_config.target_resolution,
+        )
+        process_with_bands = partial(
+            self._process_sensor_item,
+            sensor_config=sensor_config,
+            binding=binding,
+            geojson_cutline=geojson_path,
+            vsi_prefix=vsi_prefix,
+            data_folder=data_folder,
+            band_executor=band_executor,
+        )
+        # Skip items that don't have the required band assets
         # (e.g. Landsat 7 in a Landsat 8/9 query)
-        if items:
-            filtered = []
-            for item in items:
-                if all(k in item.assets for k in binding.band_asset_keys):
-                    filtered.append(item)
-            if len(filtered) < len(items):
-                print(f"Filtered {len(items) - len(filtered)} items missing "
-                      f"required bands")
-            items = filtered
+        band_keys = binding.band_asset_keys
+        items, future_to_idx, n_found, n_cached, failures = self._submit_streamed(
+            search,
+            partial(item_executor.submit, process_with_bands),
+            keep=lambda item: all(k in item.assets for k in band_keys),
+            cache_path=lambda item: get_cache_path(item.id, data_folder, sensor),
+            process_cached=process_with_bands,
+            max_pending=2 * cfg.max_concurrent_reads,
+        )
+        if len(items) < n_found:
+            print(f"Filtered {n_found - len(items)} items missing "
+                  f"required bands")
 
         print(f"STAC search ({cfg.name}/{sensor}): {len(items)} items found")
 
@@ -253,101 +533,37 @@ class STACReader:
                 f"field and date range ({start_date} to {end_date})."
             )
 
-        # Sort by datetime (some items use start_datetime instead)
-        items.sort(key=lambda x: x.datetime or x.properties.get(
-            "start_datetime", "9999"))
-
-        # Extract angles and DOYs
-        szas, vzas, raas, doys = [], [], [], []
-        for item in items:
-            sza, vza, raa = self._extract_angles(item)
-            szas.append(sza)
-            vzas.append(vza)
-            raas.append(raa)
+        # Extract angles and DOYs (items are already in datetime order)
+        angles = np.empty((3, len(items)), dtype=np.float32)
+        doys = np.empty(len(items), dtype=np.int64)
+        extract_angles = self._angle_extractor(items[0])
+        for i, item in enumerate(items):
+            angles[:, i] = extract_angles(item)
             dt = item.datetime
             if dt is None:
-                from datetime import datetime
                 dt = datetime.fromisoformat(
                     item.properties.get("start_datetime", "2000-01-01T00:00:00Z")
                     .replace("Z", "+00:00")
                 )
-            doys.append(dt.timetuple().tm_yday)
-
-        angles = np.array([szas, vzas, raas], dtype=np.float64)
-        doys = np.array(doys, dtype=np.int64)
+            doys[i] = day_of_year(dt)
 
-        # Cache status
-        n_cached = sum(
-            1 for item in items
-            if os.path.exists(get_cache_path(item.id, data_folder, sensor))
-        )
         print(f"Cache: {n_cached}/{len(items)} items cached, "
               f"{len(items) - n_cached} to download")
 
-        # Process items
-        band_pool_size = cfg.max_concurrent_reads + 4
-        process_fn = partial(
-            self._process_sensor_item,
-            sensor_config=sensor_config,
-            binding=binding,
-            geojson_cutline=geojson_path,
-            vsi_prefix=vsi_prefix,
-            data_folder=data_folder,
+        refs, ok, mask, geotransform, crs = self._collect_results(
+            future_to_idx, items, desc=f"Processing {sensor} items ({cfg.name})",
+            dtype=cfg.refl_dtype, failures=failures,
         )
-
-        failed_items = []
-        with ThreadPoolExecutor(max_workers=band_pool_size) as band_executor:
-            process_with_bands = partial(process_fn, band_executor=band_executor)
-            with ThreadPoolExecutor(max_workers=len(items)) as item_executor:
-                future_to_idx = {
-                    item_executor.submit(process_with_bands, item): i
-                    for i, item in enumerate(items)
-                }
-                results = [None] * len(items)
-                for future in tqdm(
-                    as_completed(future_to_idx),
-                    total=len(items),
-                    desc=f"Processing {sensor} items ({cfg.name})",
-                    unit="item",
-                ):
-                    idx = future_to_idx[future]
-                    try:
-                        results[idx] = future.result()
-                    except Exception as e:
-                        item_id = items[idx].id
-                        print(f"\nWarning: failed to process {item_id}: {e}")
-                        failed_items.append(idx)
-
-        if failed_items:
-            print(f"Skipped {len(failed_items)}/{len(items)} items due to errors")
-
-        # Assemble output (skip failed items)
-        reflectances = []
-        valid_indices = []
-        geotransform = None
-        crs = None
-        for i, result_item in enumerate(results):
-            if result_item is None:
-                continue
-            refl, gt, proj = result_item
-            reflectances.append(refl)
-            valid_indices.append(i)
-            if geotransform is None:
-                geotransform = gt
-                crs = proj
-
-        if not reflectances:
+        if refs is None:
             raise RuntimeError(
                 f"All {len(items)} {sensor} items failed to download."
             )
 
         # Filter angles/doys to match successful items
-        angles = angles[:, valid_indices]
-        doys = doys[valid_indices]
+        angles = angles[:, ok]
+        doys = doys[ok]
 
-        refs = np.array(reflectances, dtype=np.float32)
         uncs = sensor_config.uncertainty_fn(refs)
-        mask = np.all(np.isnan(refs), axis=(0, 1))
 
         # Compute footprint ID maps (with edge exclusion using mask)
         shape_hw = refs.shape[2:]
@@ -378,18 +594,245 @@ class STACReader:
     # Internal methods
     # -------------------------------------------------------------------
 
+    def _submit_streamed(self, items, submit, keep=None, cache_path=None,
+                         process_cached=None, max_pending: int = None):
+        """Submit search results for processing as they are yielded.
+
+        Args:
+            items: Iterable of STAC items (typically a streaming search).
+            submit: Callable taking an item and returning a Future.
+            keep: Optional predicate; items failing it are not submitted.
+            cache_path: Optional callable giving an item's cache file, used
+                to count items that were already cached when submitted.
+            process_cached: Optional callable taking an item. Items already
+                cached are passed to it directly in this thread, skipping
+                the pool; a warm fetch then starts no worker threads.
+            max_pending: Optional cap on submitted-but-unfinished items.
+                Submission blocks until one finishes, so the pool's work
+                queue never holds the whole search (and paging slows to
+                match processing).
+
+        Items are watched as they complete: if they all fail (see
+        _FailureWatch), submission stops, everything submitted is
+        cancelled and RuntimeError is raised without draining the search.
+
+        Returns:
+            (items, future_to_idx, n_found, n_cached, failures): kept items
+            sorted by datetime, each future mapped to its item's sorted
+            index, and the _FailureWatch to hand on to _collect_results.
+        """
+        failures = _FailureWatch()
+        if max_pending:
+            slots = threading.BoundedSemaphore(max_pending)
+            submit_unbounded = submit
+
+            def submit(item):
+                while not slots.acquire(timeout=0.1):
+                    if failures.broken.is_set():
+                        raise failures.error()
+                try:
+                    future = submit_unbounded(item)
+                except BaseException:
+                    slots.release()
+                    raise
+                future.add_done_callback(lambda _: slots.release())
+                return future
+
+        submitted = []
+        n_found = n_cached = 0
+        try:
+            for item in items:
+                n_found += 1
+                if keep is not None and not keep(item):
+                    continue
+                cached = cache_path is not None and cache_exists(cache_path(item))
+                n_cached += cached
+                if cached and process_cached is not None:
+                    future = _run_now(process_cached, item)
+                else:
+                    future = submit(item)
+                submitted.append((item, future))
+                failures.watch(future, item.id)
+                if failures.broken.is_set():
+                    raise failures.error()
+        except BaseException:
+            for _, future in submitted:
+                future.cancel()
+            if hasattr(items, "close"):
+                items.close()  # stop a streaming search's pager
+            raise
+
+        submitted.sort(key=lambda pair: _item_sort_key(pair[0]))
+        items = [item for item, _ in submitted]
+        future_to_idx = {future: i for i, (_, future) in enumerate(submitted)}
+        return items, future_to_idx, n_found, n_cached, failures
+
+    def _collect_results(self, future_to_idx: dict, items: list, desc: str,
+                         dtype=np.float32, failures: _FailureWatch = None):
+        """Gather per-item (refl, gt, crs, pixel_valid) futures into one stack.
+
+        The (N, B, H, W) output is allocated once, in dtype, from the first
+        result's shape, and filled in place as items complete; float32
+        item results are cast on assignment. Each item's
+        (H, W) validity is OR-ed into a running mask, so the all-NaN pixel
+        mask needs no extra pass over the stack. Failed items are reported
+        and dropped.
+
+        failures is the _FailureWatch the futures were submitted under (a
+        new one is made if omitted). Once it reports the configuration as
+        broken, pending items are cancelled and its RuntimeError is raised
+        rather than waiting out every item's retries.
+
+        Returns:
+            (refs, ok, mask, geotransform, crs): ok is a bool (N,) array
+            marking the items kept in refs; mask is True where no kept item
+            has a valid value. refs is None if every item failed.
+        """
+        n_items = len(items)
+        if failures is None:
+            # Every future is recorded below, so no callbacks are needed
+            failures = _FailureWatch()
+            failures.n_items = n_items
+        refs = None
+        any_valid = None
+        ok = np.zeros(n_items, dtype=bool)
+        georefs = [None] * n_items
+        completed = as_completed(future_to_idx)
+        if _progress_enabled(self.config.show_progress):
+            completed = _progress_bar(completed, total=n_items, desc=desc,
+                                      unit="item")
+        for future in completed:
+            idx = future_to_idx[future]
+            # The done-callback may not have run yet; record() counts once
+            failures.record(items[idx].id, future)
+            try:
+                refl, gt, proj, pixel_valid = future.result()
+                if refs is None:
+                    refs = np.empty((n_items,) + refl.shape, dtype=dtype)
+                    any_valid = np.zeros(refl.shape[1:], dtype=bool)
+                refs[idx] = refl
+                any_valid |= pixel_valid
+            except Exception as e:
+                print(f"\nWarning: failed to process {items[idx].id}: {e}")
+                if failures.broken.is_set():
+                    for pending in future_to_idx:
+                        pending.cancel()
+                    raise failures.error() from e
+                continue
+            ok[idx] = True
+            georefs[idx] = (gt, proj)
+
+        n_skipped = n_items - int(ok.sum())
+        if n_skipped:
+            print(f"Skipped {n_skipped}/{n_items} items due to errors")
+        if not ok.any():
+            return None, ok, None, None, None
+
+        geotransform, crs = georefs[int(np.argmax(ok))]
+        if n_skipped:
+            refs = refs[ok]
+        return refs, ok, ~any_valid, geotransform, crs
+
+    def _run_search(self, data_folder: str = None, refresh: bool = False,
+                    **search_kwargs):
+        """Yield items from a STAC search as result pages arrive.
+
+        Uses pystac_client, or the fast path if enabled. pystac_client
+        pages are pulled by a background thread into a bounded buffer so
+        paging overlaps with the caller's processing.
+
+        With a data_folder, results are cached there (see _cache) and a
+        repeat search is served from disk without contacting the API.
+        refresh skips the cached result and overwrites it.
+        """
+        if data_folder is None:
+            return self._search_api(**search_kwargs)
+
+        path = search_cache_path(
+            data_folder, self.config.stac_url, search_kwargs,
+            item_kind="raw" if self.config.use_fast_stac else "pystac",
+        )
+        end_date = search_kwargs["datetime"].rpartition("/")[2]
+        features = None if refresh else load_search_cache(path, end_date)
+        if features is not None:
+            return map(self._item_from_dict, features)
+        return self._caching_search(path, self._search_api(**search_kwargs))
+
+    def _item_from_dict(self, feature: dict):
+        if self.config.use_fast_stac:
+            return RawItem(feature)
+        import pystac
+        return pystac.Item.from_dict(feature)
+
+    @staticmethod
+    def _caching_search(path: str, items):
+        """Pass items through, saving them to path once the search completes."""
+        features = []
+        for item in items:
+            features.append(item.to_dict())
+            yield item
+        try:
+            save_search_cache(path, features)
+        except OSError as e:
+            print(f"Warning: could not cache STAC search results: {e}")
+
+    def _search_api(self, **search_kwargs):
+        """Run a search against the STAC API (no disk cache)."""
+        if self.config.use_fast_stac:
+            return search_items(self.config.stac_url, **search_kwargs)
+        search = self._stac_client().search(**search_kwargs)
+        return prefetch(search.items(),
+                        depth=2 * self.config.max_concurrent_reads)
+
+    def _stac_client(self):
+        """pystac_client Client for this source, opened once per reader.
+
+        Reusing it skips re-fetching the landing page on every search, and
+        its session gets a larger connection pool for paging.
+        """
+        with self._pool_lock:
+            if self._client is None:
+                import pystac_client
+                from pystac_client.stac_api_io import StacApiIO
+                from requests.adapters import HTTPAdapter
+                stac_io = StacApiIO()
+                stac_io.session.mount(
+                    "https://", HTTPAdapter(pool_connections=16, pool_maxsize=32),
+                )
+                self._client = pystac_client.Client.open(
+                    self.config.stac_url, stac_io=stac_io,
+                )
+                self._stac_session = stac_io.session
+            return self._client
+
+    def invalidate(self):
+        """Drop the cached STAC client; the next search reopens it.
+
+        For long-running processes where the catalogue's landing page or
+        conformance may change, or its connections have gone stale.
+        """
+        with self._pool_lock:
+            session = self._stac_session
+            self._client = self._stac_session = None
+        if session is not None:
+            session.close()
+
     def _search_collection(self, collection: str, geojson_geometry: dict,
                            start_date: str, end_date: str,
                            max_cloud_cover: int,
                            extra_query: dict = None,
-                           has_cloud_cover: bool = True) -> list:
-        """Search STAC catalogue for items in a given collection."""
+                           has_cloud_cover: bool = True,
+                           data_folder: str = None,
+                           refresh: bool = False):
+        """Search STAC catalogue for items in a given collection.
+
+        Returns an iterator over items in the order the server returns them.
+        """
         query = {}
         if has_cloud_cover:
             query["eo:cloud_cover"] = {"lte": max_cloud_cover}
         if extra_query:
             query.update(extra_query)
-        client = pystac_client.Client.open(self.config.stac_url)
         search_kwargs = dict(
             collections=[collection],
             intersects=geojson_geometry,
@@ -398,44 +841,61 @@ class STACReader:
         )
         if query:
             search_kwargs["query"] = query
-        search = client.search(**search_kwargs)
-        items = list(search.items())
-        # Some items (e.g. MODIS) use start_datetime instead of datetime
-        items.sort(key=lambda x: x.datetime or x.properties.get(
-            "start_datetime", "9999"))
-        return items
+        return self._run_search(data_folder, refresh, **search_kwargs)
 
     def _search(self, geojson_geometry: dict, start_date: str, end_date: str,
-                max_cloud_cover: int) -> list:
-        """Search STAC catalogue for S2 L2A items."""
-        client = pystac_client.Client.open(self.config.stac_url)
-        search = client.search(
+                max_cloud_cover: int, data_folder: str = None,
+                refresh: bool = False):
+        """Search STAC catalogue for S2 L2A items (streamed, unsorted)."""
+        return self._run_search(
+            data_folder, refresh,
             collections=[self.config.collection],
             intersects=geojson_geometry,
             datetime=f"{start_date}/{end_date}",
             query={"eo:cloud_cover": {"lte": max_cloud_cover}},
             max_items=500,
         )
-        items = list(search.items())
-        items.sort(key=lambda x: x.datetime or x.properties.get(
-            "start_datetime", "9999"))
-        return items
-
-    def _filter_mgrs(self, items: list, centroid_lon: float,
-                     centroid_lat: float) -> list:
-        """Filter items to the MGRS tile containing the field centroid."""
-        m = mgrs.MGRS()
-        target_tile = m.toMGRS(centroid_lat, centroid_lon)[:5]
-
-        filtered = []
-        for item in items:
+
+    def _mgrs_filter(self, centroid_lon: float, centroid_lat: float):
+        """Predicate selecting items on the MGRS tile containing the centroid."""
+        target_tile = mgrs_tile(centroid_lat, centroid_lon)
+
+        targets = frozenset((target_tile, f"MGRS-{target_tile}"))
+        keys = self.config.mgrs_property_keys
+
+        if len(keys) == 1:
+            key = keys[0]
+            return lambda it: it.properties.get(key) in targets
+        return lambda it: any(it.properties.get(k) in targets for k in keys)
+
+    def _angle_extractor(self, sample):
+        """Return an _extract_angles equivalent specialised to sample's keys.
+
+        Items from one search share a property schema, so the sun-angle
+        keys are resolved once instead of through a fallback chain per
+        item. Items missing those keys go through _extract_angles.
+        """
+        props = sample.properties
+        elev_key = next((k for k in ("view:sun_elevation", "s2:mean_solar_zenith")
+                         if k in props), None)
+        az_key = next((k for k in ("view:sun_azimuth", "s2:mean_solar_azimuth")
+                       if k in props), None)
+        if elev_key is None or az_key is None:
+            return self._extract_angles
+        generic = self._extract_angles
+
+        def extract(item):
             props = item.properties
-            for key in self.config.mgrs_property_keys:
-                val = props.get(key, "")
-                if val == f"MGRS-{target_tile}" or val == target_tile:
-                    filtered.append(item)
-                    break
-        return filtered
+            try:
+                sun_elevation = props[elev_key]
+                sun_azimuth = props[az_key]
+            except KeyError:
+                return generic(item)
+            sza = 90.0 - sun_elevation if sun_elevation < 90 else sun_elevation
+            raa = (props.get("view:azimuth", 0.0) - sun_azimuth) % 360.0
+            return sza, props.get("view:incidence_angle", 0.0), raa
+
+        return extract
 
     def _extract_angles(self, item) -> tuple:
         """Extract (SZA, VZA, RAA) in degrees from STAC item properties."""
@@ -457,7 +917,7 @@ class STACReader:
         return sza, view_zenith, raa
 
     def _read_all_bands(self, item, geojson_cutline: str, vsi_prefix: str,
-                        band_executor: ThreadPoolExecutor = None):
+                        band_executor: _ConfiguredExecutor = None):
         """Read all 10 spectral bands + SCL for a single STAC item."""
         cfg = self.config
 
@@ -466,59 +926,64 @@ class STACReader:
             asset = item.assets.get(asset_key)
             if asset is None:
                 raise KeyError(f"Asset '{asset_key}' not found in item {item.id}")
-            band_tasks.append((asset_key, asset.href, 'bilinear'))
+            band_tasks.append((asset_key, asset.href, 'bilinear', 'int16'))
 
         scl_asset = item.assets.get(cfg.scl_asset_key)
         if scl_asset is None:
             raise KeyError(f"Asset '{cfg.scl_asset_key}' not found in item {item.id}")
-        band_tasks.append((cfg.scl_asset_key, scl_asset.href, 'nearest'))
-
-        read_fn = partial(
-            read_and_crop_band,
-            geojson_cutline=geojson_cutline,
-            semaphore=self._semaphore,
-            vsi_prefix=vsi_prefix,
-            transform_href=cfg.transform_href,
-            s3_endpoint=cfg.s3_endpoint,
-        )
+        band_tasks.append((cfg.scl_asset_key, scl_asset.href, 'nearest', 'uint8'))
+
+        # Bands are copied straight into one preallocated (bands, H, W)
+        # buffer as they arrive; slot n_bands is the SCL layer
+        n_bands = len(cfg.band_assets)
+        band_data = None
+        scl_data = None
+        geotransform = crs = None
+
+        def place(slot, result):
+            nonlocal band_data, scl_data, geotransform, crs
+            data, gt, proj = result
+            if slot == n_bands:
+                scl_data = data
+                return
+            if band_data is None:
+                band_data = np.empty((n_bands,) + data.shape, dtype=data.dtype)
+            band_data[slot] = data
+            if slot == 0:
+                geotransform, crs = gt, proj
 
         if band_executor is not None:
-            futures = {}
-            for asset_key, href, resample in band_tasks:
-                future = band_executor.submit(
-                    read_fn, href, resample_alg=resample,
-                )
-                futures[future] = asset_key
-            results = {}
-            for future in as_completed(futures):
-                results[futures[future]] = future.result()
+            # Assets that point at the same file are read once
+            slots = {}
+            for slot, (_, href, resample, data_type) in enumerate(band_tasks):
+                slots.setdefault((href, resample, data_type), []).append(slot)
+            pending = {band_executor.read(*task): task for task in slots}
+            for future in as_completed(pending):
+                result = future.result()
+                for slot in slots[pending[future]]:
+                    place(slot, result)
         else:
-            results = {}
-            for asset_key, href, resample in band_tasks:
-                results[asset_key] = read_fn(href, resample_alg=resample)
-
-        # Assemble in band order
-        bands = []
-        geotransform = None
-        crs = None
-        for asset_key in cfg.band_assets:
-            data, gt, proj = results[asset_key]
-            bands.append(data)
-            if geotransform is None:
-                geotransform = gt
-                crs = proj
+            read_kwargs = dict(
+                geojson_cutline=geojson_cutline,
+                vsi_prefix=vsi_prefix,
+                transform_href=cfg.transform_href,
+                s3_endpoint=cfg.s3_endpoint,
+            )
+            for slot, (_, href, resample, data_type) in enumerate(band_tasks):
+                place(slot, read_and_crop_band(
+                    href, resample_alg=resample, data_type=data_type,
+                    **read_kwargs,
+                ))
 
-        scl_data, _, _ = results[cfg.scl_asset_key]
-        band_data = np.stack(bands, axis=0)
         return band_data, scl_data, geotransform, crs
 
     def _process_item(self, item, geojson_cutline: str, vsi_prefix: str,
                       data_folder: str,
-                      band_executor: ThreadPoolExecutor = None):
+                      band_executor: _ConfiguredExecutor = None):
         """Process a single STAC item: read, convert, mask."""
         cache_path = get_cache_path(item.id, data_folder)
 
-        if os.path.exists(cache_path):
+        if cache_exists(cache_path):
             band_data, scl_data, geotransform, crs = load_from_cache(cache_path)
         else:
             band_data, scl_data, geotransform, crs = self._read_all_bands(
@@ -529,15 +994,17 @@ class STACReader:
         baseline = item.properties.get(
             self.config.processing_baseline_property, '05.00'
         )
-        reflectance = dn_to_reflectance(band_data, baseline)
-        reflectance = apply_scl_cloud_mask(reflectance, scl_data)
+        reflectance = apply_scl_cloud_mask(
+            dn_to_reflectance(band_data, baseline), scl_data)
 
-        return reflectance, geotransform, crs
+        # Converted DNs are never NaN, so any NaN came from the SCL mask
+        return reflectance, geotransform, crs, ~np.isnan(reflectance[0])
 
     def _read_sensor_bands(self, item, binding: SensorPlatformBinding,
                            geojson_cutline: str, vsi_prefix: str,
                            target_resolution: int = 10,
-                           band_executor: ThreadPoolExecutor = None):
+                           band_executor: _ConfiguredExecutor = None,
+                           qa_data_type: str = 'int16'):
         """Read all spectral bands + QA for a generic sensor item."""
         cfg = self.config
 
@@ -546,7 +1013,8 @@ class STACReader:
             asset = item.assets.get(asset_key)
             if asset is None:
                 raise KeyError(f"Asset '{asset_key}' not found in item {item.id}")
-            band_tasks.append((asset_key, asset.href, binding.resample_alg))
+            band_tasks.append((asset_key, asset.href, binding.resample_alg,
+                               'int16'))
 
         qa_asset = item.assets.get(binding.qa_asset_key)
         if qa_asset is None:
@@ -554,32 +1022,33 @@ class STACReader:
                 f"QA asset '{binding.qa_asset_key}' not found in item {item.id}"
             )
         band_tasks.append((binding.qa_asset_key, qa_asset.href,
-                           binding.qa_resample_alg))
-
-        read_fn = partial(
-            read_and_crop_band,
-            geojson_cutline=geojson_cutline,
-            semaphore=self._semaphore,
-            vsi_prefix=vsi_prefix,
-            transform_href=cfg.transform_href,
-            s3_endpoint=cfg.s3_endpoint,
-            target_resolution=target_resolution,
-        )
+                           binding.qa_resample_alg, qa_data_type))
 
         if band_executor is not None:
+            # Assets that point at the same file are read once
             futures = {}
-            for asset_key, href, resample in band_tasks:
-                future = band_executor.submit(
-                    read_fn, href, resample_alg=resample,
-                )
-                futures[future] = asset_key
-            results = {}
-            for future in as_completed(futures):
-                results[futures[future]] = future.result()
+            for asset_key, href, resample, data_type in band_tasks:
+                task = (href, resample, data_type)
+                if task not in futures:
+                    futures[task] = band_executor.read(*task)
+            results = {
+                asset_key: futures[(href, resample, data_type)].result()
+                for asset_key, href, resample, data_type in band_tasks
+            }
         else:
+            read_kwargs = dict(
+                geojson_cutline=geojson_cutline,
+                vsi_prefix=vsi_prefix,
+                transform_href=cfg.transform_href,
+                s3_endpoint=cfg.s3_endpoint,
+                target_resolution=target_resolution,
+            )
             results = {}
-            for asset_key, href, resample in band_tasks:
-                results[asset_key] = read_fn(href, resample_alg=resample)
+            for asset_key, href, resample, data_type in band_tasks:
+                results[asset_key] = read_and_crop_band(
+                    href, resample_alg=resample, data_type=data_type,
+                    **read_kwargs,
+                )
 
         # Assemble in band order
         bands = []
@@ -600,34 +1069,69 @@ class STACReader:
                              binding: SensorPlatformBinding,
                              geojson_cutline: str, vsi_prefix: str,
                              data_folder: str,
-                             band_executor: ThreadPoolExecutor = None):
+                             band_executor: _ConfiguredExecutor = None):
         """Process a single STAC item for a generic sensor."""
         sensor = sensor_config.name
         cache_path = get_cache_path(item.id, data_folder, sensor)
 
-        if os.path.exists(cache_path):
+        if cache_exists(cache_path):
             band_data, qa_data, geotransform, crs = load_from_cache(cache_path)
         else:
             band_data, qa_data, geotransform, crs = self._read_sensor_bands(
                 item, binding, geojson_cutline, vsi_prefix,
                 target_resolution=sensor_config.target_resolution,
                 band_executor=band_executor,
+                qa_data_type=np.dtype(sensor_config.qa_dtype).name,
             )
             save_to_cache(cache_path, band_data, qa_data, geotransform, crs)
 
-        # DN to reflectance
-        metadata = dict(item.properties)
-        metadata["processing_baseline"] = metadata.get(
-            self.config.processing_baseline_property, "05.00"
+        # DN to reflectance. The baseline is layered over the item's
+        # properties rather than copied into a fresh dict per item
+        props = item.properties
+        metadata = ChainMap(
+            {"processing_baseline": props.get(
+                self.config.processing_baseline_property, "05.00")},
+            props,
         )
-        reflectance = sensor_config.dn_to_reflectance(band_data, metadata)
+        reflectance, valid = sensor_config.dn_to_reflectance(band_data, metadata)
 
         # Cloud masking
         if sensor_config.cloud_mask_fn is not None:
-            cloud_mask = sensor_config.cloud_mask_fn(qa_data)
-            reflectance[:, cloud_mask] = np.nan
+            valid &= ~sensor_config.cloud_mask_fn(qa_data)
         elif sensor == "sentinel2":
             # Use existing SCL-based masking for S2
-            reflectance = apply_scl_cloud_mask(reflectance, qa_data)
+            valid &= ~scl_cloud_mask(qa_data)
+        mask_invalid(reflectance, valid)
+
+        return reflectance, geotransform, crs, valid.any(axis=0)
+
+
+_SHARED_READERS = {}
+_shared_lock = threading.Lock()
+
+
+def shared_reader(config: SourceConfig) -> STACReader:
+    """Process-wide STACReader for a source, used by the top-level API.
+
+    Its thread pools, STAC client and in-flight reads are kept across
+    calls, so fetching many fields in a loop does not start new threads
+    every time. Readers are closed at interpreter exit.
+    """
+    with _shared_lock:
+        old = _SHARED_READERS.get(config.name)
+        if old is not None and old.config is config:
+            return old
+        reader = _SHARED_READERS[config.name] = STACReader(config)
+    if old is not None:
+        # Work already queued on it still runs; new submissions are refused
+        old.close(wait=False)
+    return reader
+
 
-        return reflectance, geotransform, crs
+@atexit.register
+def _close_shared_readers():
+    with _shared_lock:
+        readers = list(_SHARED_READERS.values())
+        _SHARED_READERS.clear()
+    for reader in readers:
+        reader.close(wait=False)
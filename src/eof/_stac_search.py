@@ -0,0 +1,183 @@
+"""Lightweight STAC item search over plain HTTP.
+
+An opt-in alternative to pystac_client (SourceConfig.use_fast_stac) that
+skips pystac.Item construction and validation. Readers only need an
+item's id, datetime, properties and asset hrefs, so features are wrapped
+in a minimal object exposing just those. orjson is used for parsing when
+installed.
+"""
+
+import queue
+import threading
+from collections import namedtuple
+from datetime import datetime
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+_PAGE_LIMIT = 100
+
+Asset = namedtuple("Asset", ["href"])
+
+
+class RawItem:
+    """Minimal stand-in for pystac.Item built directly from GeoJSON."""
+
+    __slots__ = ("id", "collection_id", "datetime", "properties", "assets")
+
+    def __init__(self, feature: dict):
+        self.id = feature["id"]
+        self.collection_id = feature.get("collection")
+        self.properties = feature.get("properties", {})
+        self.datetime = parse_datetime(self.properties.get("datetime"))
+        self.assets = {
+            key: Asset(asset["href"])
+            for key, asset in feature.get("assets", {}).items()
+        }
+
+    def __repr__(self):
+        return f"<RawItem id={self.id}>"
+
+    def to_dict(self) -> dict:
+        """GeoJSON-like dict of the fields kept; RawItem(d) round-trips."""
+        return {
+            "id": self.id,
+            "collection": self.collection_id,
+            "properties": self.properties,
+            "assets": {k: {"href": a.href} for k, a in self.assets.items()},
+        }
+
+
+def parse_datetime(value):
+    """Parse an RFC 3339 STAC datetime; None if missing."""
+    if not value:
+        return None
+    value = value.replace("Z", "+00:00")
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        # Python < 3.11 only accepts 3 or 6 fractional digits
+        head, _, rest = value.partition(".")
+        frac = rest[:-6] if rest[-6:-5] in "+-" else rest
+        tz = rest[len(frac):]
+        return datetime.fromisoformat(f"{head}.{frac[:6].ljust(6, '0')}{tz}")
+
+
+_SESSION = None
+_session_lock = threading.Lock()
+
+
+def _session():
+    """Shared requests.Session so paging reuses pooled connections."""
+    global _SESSION
+    if _SESSION is None:
+        with _session_lock:
+            if _SESSION is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                session = requests.Session()
+                session.mount("https://", HTTPAdapter(pool_connections=16,
+                                                      pool_maxsize=32))
+                _SESSION = session
+    return _SESSION
+
+
+def _loads(content: bytes) -> dict:
+    if _orjson is not None:
+        return _orjson.loads(content)
+    import json
+    return json.loads(content)
+
+
+_END = object()
+
+
+def prefetch(iterable, depth: int = 1):
+    """Iterate iterable in a background thread, staying up to depth ahead.
+
+    Lets the next STAC page download while the current one is consumed.
+    Exceptions from the producer are re-raised in the consumer; closing
+    the returned generator early stops the producer.
+    """
+    buf = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(entry):
+        while not stop.is_set():
+            try:
+                buf.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for value in iterable:
+                if not put((value, None)):
+                    return
+        except BaseException as e:
+            put((_END, e))
+            return
+        put((_END, None))
+
+    threading.Thread(target=produce, name="eof-stac-prefetch",
+                     daemon=True).start()
+    try:
+        while True:
+            value, err = buf.get()
+            if value is _END:
+                if err is not None:
+                    raise err
+                return
+            yield value
+    finally:
+        stop.set()
+
+
+def _pages(stac_url: str, body: dict):
+    """Yield raw /search result pages, following next links."""
+    session = _session()
+    url, method = f"{stac_url.rstrip('/')}/search", "POST"
+    while url:
+        if method == "POST":
+            resp = session.post(url, json=body, timeout=60)
+        else:
+            resp = session.get(url, timeout=60)
+        resp.raise_for_status()
+        page = _loads(resp.content)
+        yield page
+
+        url = None
+        for link in page.get("links", ()):
+            if link.get("rel") == "next":
+                url = link["href"]
+                method = link.get("method", "GET").upper()
+                if method == "POST" and "body" in link:
+                    body = {**body, **link["body"]} if link.get("merge") else link["body"]
+                break
+
+
+def search_items(stac_url: str, max_items: int = 500, **params):
+    """Yield RawItems from a STAC /search, following next links.
+
+    params are STAC search body fields (collections, intersects, datetime,
+    query, ...); None values are dropped. The next page is fetched in the
+    background while the current one is being consumed.
+    """
+    body = {k: v for k, v in params.items() if v is not None}
+    body["limit"] = min(max_items, _PAGE_LIMIT)
+
+    n_items = 0
+    pages = prefetch(_pages(stac_url, body))
+    try:
+        for page in pages:
+            for feature in page.get("features", ()):
+                yield RawItem(feature)
+                n_items += 1
+                if n_items >= max_items:
+                    return
+    finally:
+        pages.close()
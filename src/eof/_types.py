@@ -1,8 +1,12 @@
 """Result types and constants for eof."""
 
+import sys
 from dataclasses import dataclass
 import numpy as np
 
+# __slots__ dataclasses need Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 # The 10 Sentinel-2 spectral bands in ARC order
 BAND_NAMES = ('B02', 'B03', 'B04', 'B05', 'B06', 'B07', 'B08', 'B8A', 'B11', 'B12')
 
@@ -13,19 +17,19 @@ QUANTIFICATION_VALUE = 10000.0
 BASELINE_OFFSET = -1000
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class S2Result:
     """Result of a Sentinel-2 data retrieval."""
     reflectance: np.ndarray     # (N_images, 10, H, W) float32 [0, 1]
     uncertainty: np.ndarray     # (N_images, 10, H, W) float32
-    angles: np.ndarray          # (3, N_images) float64 [SZA, VZA, RAA] degrees
+    angles: np.ndarray          # (3, N_images) float32 [SZA, VZA, RAA] degrees
     doys: np.ndarray            # (N_images,) int64
     mask: np.ndarray            # (H, W) bool
     geotransform: tuple         # 6-tuple GDAL geotransform
     crs: str                    # WKT projection string
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class EOResult:
     """Result of a multi-sensor EO data retrieval.
 
@@ -35,7 +39,7 @@ class EOResult:
     """
     reflectance: np.ndarray       # (N_images, n_bands, H, W) float32 [0, 1]
     uncertainty: np.ndarray       # (N_images, n_bands, H, W) float32
-    angles: np.ndarray            # (3, N_images) float64 [SZA, VZA, RAA] degrees
+    angles: np.ndarray            # (3, N_images) float32 [SZA, VZA, RAA] degrees
     doys: np.ndarray              # (N_images,) int64
     mask: np.ndarray              # (H, W) bool — True where all-NaN
     geotransform: tuple           # 6-tuple GDAL geotransform (10m grid)
@@ -0,0 +1,93 @@
+"""Per-item on-disk cache."""
+
+import os
+
+import numpy as np
+
+from eof._cache import (
+    cache_exists, get_cache_path, load_from_cache, save_to_cache,
+)
+
+GT = (500000.0, 10.0, 0.0, 4200000.0, 0.0, -10.0)
+CRS = 'PROJCS["WGS 84 / UTM zone 10N"]'
+
+
+def _arrays():
+    rng = np.random.default_rng(1)
+    bands = rng.integers(0, 10000, size=(10, 16, 12)).astype(np.int16)
+    qa = rng.integers(0, 12, size=(16, 12)).astype(np.uint8)
+    return bands, qa
+
+
+def test_cache_path_layout(tmp_path):
+    folder = str(tmp_path)
+    assert get_cache_path("a/b", folder) == os.path.join(folder, "a_b")
+    assert get_cache_path("x", folder, "sentinel2") == os.path.join(folder, "x")
+    assert get_cache_path("x", folder, "landsat") == os.path.join(folder, "landsat_x")
+
+
+def test_save_load_round_trip(tmp_path):
+    bands, qa = _arrays()
+    path = get_cache_path("S2A_ITEM", str(tmp_path))
+    assert not cache_exists(path)
+
+    save_to_cache(path, bands, qa, GT, CRS)
+
+    assert cache_exists(path)
+    assert sorted(os.listdir(path)) == ["bands.npy", "meta.json", "qa.npy"]
+    # No temporary directories are left next to the entry
+    assert os.listdir(tmp_path) == ["S2A_ITEM"]
+
+    band_data, qa_data, gt, crs = load_from_cache(path)
+    assert isinstance(band_data, np.memmap) and not band_data.flags.writeable
+    np.testing.assert_array_equal(band_data, bands)
+    np.testing.assert_array_equal(qa_data, qa)
+    assert band_data.dtype == np.int16 and qa_data.dtype == np.uint8
+    assert gt == GT and isinstance(gt, tuple)
+    assert crs == CRS
+
+
+def test_save_over_existing_entry_keeps_it(tmp_path):
+    bands, qa = _arrays()
+    path = get_cache_path("S2A_ITEM", str(tmp_path))
+    save_to_cache(path, bands, qa, GT, CRS)
+    # A second worker caching the same item must not fail or leave debris
+    save_to_cache(path, bands, qa, GT, CRS)
+    assert os.listdir(tmp_path) == ["S2A_ITEM"]
+    np.testing.assert_array_equal(load_from_cache(path)[0], bands)
+
+
+def test_legacy_npz_is_upgraded_on_load(tmp_path):
+    bands, qa = _arrays()
+    path = get_cache_path("S2A_OLD", str(tmp_path))
+    np.savez_compressed(path, band_data=bands, scl_data=qa,
+                        geotransform=np.array(GT), crs=np.array(CRS))
+    assert cache_exists(path)
+
+    band_data, qa_data, gt, crs = load_from_cache(path)
+
+    np.testing.assert_array_equal(band_data, bands)
+    np.testing.assert_array_equal(qa_data, qa)
+    assert gt == GT and crs == CRS
+    # Written in the directory layout; the .npz stays for ARC/older eof
+    assert os.path.isdir(path) and cache_exists(path)
+    with np.load(path + ".npz") as f:
+        np.testing.assert_array_equal(f["band_data"], bands)
+
+    band_data, _, gt, crs = load_from_cache(path)
+    assert isinstance(band_data, np.memmap)
+    np.testing.assert_array_equal(band_data, bands)
+    assert gt == GT and crs == CRS
+
+
+def test_legacy_npz_removed_only_on_opt_in(tmp_path, monkeypatch):
+    bands, qa = _arrays()
+    path = get_cache_path("S2A_OLD", str(tmp_path))
+    np.savez_compressed(path, band_data=bands, scl_data=qa,
+                        geotransform=np.array(GT), crs=np.array(CRS))
+
+    monkeypatch.setenv("EOF_REMOVE_LEGACY_CACHE", "1")
+    load_from_cache(path)
+
+    assert not os.path.exists(path + ".npz")
+    np.testing.assert_array_equal(load_from_cache(path)[0], bands)
@@ -0,0 +1,79 @@
+"""Band reads identical to one still in flight share its Future."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import eof._stac_reader as stac_reader
+from eof._stac_reader import _ConfiguredExecutor
+
+READ_KWARGS = dict(geojson_cutline="field.geojson", vsi_prefix="/vsicurl")
+
+
+@pytest.fixture
+def band_pool():
+    pool = ThreadPoolExecutor(4)
+    yield pool
+    pool.shutdown()
+
+
+def _executor(monkeypatch, band_pool, fail=False):
+    """Executor whose reads block until release is set, counting calls."""
+    calls, release = [], threading.Event()
+
+    def fake_read(href, **kwargs):
+        calls.append(href)
+        release.wait(5)
+        if fail:
+            raise IOError(f"Failed to read band from {href}")
+        return href
+
+    monkeypatch.setattr(stac_reader, "read_and_crop_band", fake_read)
+    inflight = ({}, threading.RLock())
+    executor = _ConfiguredExecutor(band_pool, lambda: None, dict(READ_KWARGS),
+                                   inflight)
+    return executor, inflight[0], calls, release
+
+
+def _settled(future):
+    """Event set after the future's earlier done-callbacks have run."""
+    done = threading.Event()
+    future.add_done_callback(lambda _: done.set())
+    return done
+
+
+@pytest.mark.parametrize("fail", [False, True])
+def test_concurrent_reads_of_one_href_share_a_warp(monkeypatch, band_pool, fail):
+    executor, pending, calls, release = _executor(monkeypatch, band_pool, fail)
+
+    first = executor.read("https://example.com/B04.tif", "bilinear", "int16")
+    second = executor.read("https://example.com/B04.tif", "bilinear", "int16")
+    assert second is first
+    assert len(pending) == 1
+    settled = _settled(first)
+
+    release.set()
+    if fail:
+        with pytest.raises(IOError):
+            first.result(timeout=5)
+    else:
+        assert first.result(timeout=5) == "https://example.com/B04.tif"
+
+    assert settled.wait(5)
+    assert calls == ["https://example.com/B04.tif"]
+    # The entry is dropped once the read settles, whatever its outcome
+    assert pending == {}
+
+
+def test_settled_read_is_not_reused(monkeypatch, band_pool):
+    executor, pending, calls, release = _executor(monkeypatch, band_pool)
+    release.set()
+
+    for resample_alg in ("bilinear", "bilinear", "nearest"):
+        future = executor.read("https://example.com/B04.tif", resample_alg,
+                               "int16")
+        assert _settled(future).wait(5)
+
+    assert len(calls) == 3
+    assert pending == {}
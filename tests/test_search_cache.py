@@ -0,0 +1,106 @@
+"""STAC search result caching in data_folder."""
+
+import dataclasses
+import os
+import time
+from datetime import date
+
+import pytest
+
+from eof._cache import load_search_cache, save_search_cache
+from eof._source_configs import get_config
+from eof._stac_reader import STACReader
+from eof._stac_search import RawItem
+
+pystac = pytest.importorskip("pystac")
+
+SEARCH = dict(collections=["sentinel-2-l2a"],
+              datetime="2020-01-01T00:00:00Z/2020-02-01T23:59:59Z")
+
+
+def _feature(i):
+    return {
+        "type": "Feature",
+        "stac_version": "1.0.0",
+        "id": f"S2A_TEST_{i}",
+        "collection": "sentinel-2-l2a",
+        "geometry": {"type": "Point", "coordinates": [-122.0, 37.0]},
+        "bbox": [-122.0, 37.0, -122.0, 37.0],
+        "properties": {"datetime": f"2020-01-{i + 1:02d}T19:00:00Z",
+                       "s2:processing_baseline": "02.14"},
+        "links": [],
+        "assets": {"red": {"href": f"https://example.com/{i}/B04.tif"}},
+    }
+
+
+FEATURES = [_feature(i) for i in range(3)]
+
+
+def _reader(use_fast_stac, api_calls):
+    cfg = dataclasses.replace(get_config("aws"), use_fast_stac=use_fast_stac)
+    reader = STACReader(cfg)
+
+    def search_api(**search_kwargs):
+        api_calls.append(search_kwargs)
+        if use_fast_stac:
+            return iter([RawItem(f) for f in FEATURES])
+        return iter([pystac.Item.from_dict(f) for f in FEATURES])
+
+    reader._search_api = search_api
+    return reader
+
+
+@pytest.mark.parametrize("use_fast_stac", [False, True])
+def test_search_cache_round_trip(tmp_path, use_fast_stac):
+    api_calls = []
+    reader = _reader(use_fast_stac, api_calls)
+    item_type = RawItem if use_fast_stac else pystac.Item
+
+    first = list(reader._run_search(data_folder=str(tmp_path), **SEARCH))
+    second = list(reader._run_search(data_folder=str(tmp_path), **SEARCH))
+
+    assert len(api_calls) == 1
+    assert [i.id for i in second] == [i.id for i in first]
+    assert all(isinstance(i, item_type) for i in second)
+    assert second[0].properties == FEATURES[0]["properties"]
+    assert second[0].assets["red"].href == FEATURES[0]["assets"]["red"]["href"]
+
+
+@pytest.mark.parametrize("first_fast", [True, False])
+def test_search_cache_kinds_do_not_mix(tmp_path, first_fast):
+    fast_calls, full_calls = [], []
+    readers = {True: _reader(True, fast_calls), False: _reader(False, full_calls)}
+
+    list(readers[first_fast]._run_search(data_folder=str(tmp_path), **SEARCH))
+    items = list(readers[not first_fast]._run_search(
+        data_folder=str(tmp_path), **SEARCH))
+
+    # The second reader's format was not cached yet, so it hit the API
+    assert len(fast_calls) == 1 and len(full_calls) == 1
+    second_type = pystac.Item if first_fast else RawItem
+    assert all(isinstance(i, second_type) for i in items)
+
+
+def test_refresh_search_replaces_cached_result(tmp_path):
+    api_calls = []
+    reader = _reader(True, api_calls)
+
+    list(reader._run_search(data_folder=str(tmp_path), **SEARCH))
+    list(reader._run_search(data_folder=str(tmp_path), refresh=True, **SEARCH))
+    list(reader._run_search(data_folder=str(tmp_path), **SEARCH))
+
+    # The refreshed result was saved and served the third search
+    assert len(api_calls) == 2
+
+
+@pytest.mark.parametrize("age_days, expected", [(29, True), (31, False)])
+def test_settled_search_cache_expires(tmp_path, age_days, expected):
+    path = tmp_path / "search.json"
+    save_search_cache(str(path), [dict(FEATURES[0])])
+    mtime = time.time() - age_days * 24 * 3600
+    os.utime(path, (mtime, mtime))
+
+    # A 2020 search has long settled but is still refreshed eventually
+    assert (load_search_cache(str(path), "2020-02-01") is not None) == expected
+    # An unsettled one goes stale after a day
+    assert load_search_cache(str(path), date.today().isoformat()) is None
@@ -0,0 +1,78 @@
+"""Sensor DN conversion and uncertainty."""
+
+import numpy as np
+import pytest
+
+from eof._scl import dn_to_reflectance
+from eof._sensor_configs import (
+    SENSOR_CONFIGS, _default_uncertainty, all_nan_mask, mask_invalid,
+)
+
+
+def _dn_stack(dtype=np.int16, shape=(3, 8, 8), seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 12000, size=shape).astype(dtype)
+
+
+@pytest.mark.parametrize("baseline", ["02.14", "04.00", "05.09"])
+def test_s2_reflectance_is_non_negative(baseline):
+    # With BOA_ADD_OFFSET, DNs below 1000 would go negative without the clamp
+    refl = dn_to_reflectance(_dn_stack(), baseline)
+    assert refl.dtype == np.float32
+    assert (refl >= 0).all()
+
+
+@pytest.mark.parametrize("sensor", sorted(SENSOR_CONFIGS))
+def test_sensor_reflectance_is_non_negative_or_nan(sensor):
+    cfg = SENSOR_CONFIGS[sensor]
+    dn = _dn_stack() - 200  # include negative DNs
+    refl, valid = cfg.dn_to_reflectance(dn, {"processing_baseline": "05.00"})
+    mask_invalid(refl, valid)
+    assert np.all((refl >= 0) | np.isnan(refl))
+
+
+def test_default_uncertainty_is_ten_percent_and_non_negative():
+    refl = dn_to_reflectance(_dn_stack(), "05.00")
+    refl[0, 0, 0] = np.nan
+    before = refl.copy()
+
+    unc = _default_uncertainty(refl)
+
+    assert unc.dtype == np.float32
+    assert not np.shares_memory(unc, refl)
+    np.testing.assert_array_equal(refl, before)  # input left untouched
+    np.testing.assert_allclose(unc, np.abs(before) * np.float32(0.1))
+    assert np.isnan(unc[0, 0, 0])
+    assert (unc[~np.isnan(unc)] >= 0).all()
+
+
+def test_default_uncertainty_of_negative_input_is_non_negative():
+    refl = np.array([-0.2, -0.0, 0.0, 0.5], dtype=np.float32)
+    unc = _default_uncertainty(refl)
+    assert (unc >= 0).all()
+    np.testing.assert_allclose(unc, [0.02, 0.0, 0.0, 0.05], rtol=1e-6)
+
+
+def _nan_stack(kind, shape=(6, 3, 16, 16), seed=0):
+    rng = np.random.default_rng(seed)
+    refs = rng.random(shape, dtype=np.float32)
+    if kind == "dense":
+        # Most pixels are still empty after each step: whole-step reductions
+        refs[rng.random(shape) < 0.8] = np.nan
+    elif kind == "sparse":
+        # Under 1/8 of pixels are empty after the first step: gathered path
+        refs[rng.random(shape) < 0.8] = np.nan
+        refs[0, :, 2:, :] = 0.5
+        refs[:, :, 0, :4] = np.nan
+    else:
+        refs[:] = np.nan
+    return refs
+
+
+@pytest.mark.parametrize("kind", ["dense", "sparse", "all_nan"])
+def test_all_nan_mask_matches_full_reduction(kind):
+    refs = _nan_stack(kind)
+    expected = np.isnan(refs).all(axis=(0, 1))
+    if kind != "all_nan":
+        assert expected.any() and not expected.all()
+    np.testing.assert_array_equal(all_nan_mask(refs), expected)
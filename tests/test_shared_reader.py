@@ -0,0 +1,24 @@
+"""Process-wide STACReader reuse."""
+
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor
+
+from eof._source_configs import get_config
+from eof._stac_reader import shared_reader
+
+
+def test_shared_reader_is_reused_per_config():
+    cfg = get_config("planetary")
+    assert shared_reader(cfg) is shared_reader(cfg)
+
+
+def test_replaced_shared_reader_is_closed():
+    old = shared_reader(get_config("aws"))
+    item_pool = old._item_pool = ThreadPoolExecutor(1)
+    band_pool = old._band_pool = ThreadPoolExecutor(1)
+
+    new = shared_reader(dataclasses.replace(get_config("aws"), show_progress=False))
+
+    assert new is not old
+    assert old._item_pool is None and old._band_pool is None
+    assert item_pool._shutdown and band_pool._shutdown
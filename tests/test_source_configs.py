@@ -0,0 +1,45 @@
+"""Process-wide GDAL configuration."""
+
+import sys
+import types
+
+import pytest
+
+from eof import _source_configs
+
+
+@pytest.fixture
+def fake_gdal(monkeypatch):
+    """Record process-wide GDAL settings without a GDAL install."""
+    gdal = types.SimpleNamespace(options={}, cache_max=None)
+    gdal.SetConfigOption = gdal.options.__setitem__
+
+    def set_cache_max(n):
+        gdal.cache_max = n
+
+    gdal.SetCacheMax = set_cache_max
+    osgeo = types.ModuleType("osgeo")
+    osgeo.gdal = gdal
+    monkeypatch.setitem(sys.modules, "osgeo", osgeo)
+    monkeypatch.setitem(sys.modules, "osgeo.gdal", gdal)
+    monkeypatch.setenv("EOF_GDAL_CACHEMAX_MB", "2048")
+    _source_configs._default_cache_mb.cache_clear()
+    _source_configs._configure_gdal_once.cache_clear()
+    yield gdal
+    _source_configs._default_cache_mb.cache_clear()
+    _source_configs._configure_gdal_once.cache_clear()
+
+
+def test_single_process_gets_full_cache_budget(fake_gdal, monkeypatch):
+    monkeypatch.setattr(_source_configs, "_CACHE_SHARERS", 1)
+    _source_configs._configure_gdal_once()
+    assert fake_gdal.cache_max == 2048 * 2**20
+    assert fake_gdal.options["CPL_VSIL_CURL_CACHE_SIZE"] == str(1024 * 2**20)
+
+
+def test_pool_workers_split_cache_budget(fake_gdal, monkeypatch):
+    monkeypatch.setattr(_source_configs, "_CACHE_SHARERS", 1)
+    _source_configs.set_gdal_cache_share(16)
+    _source_configs._configure_gdal_once()
+    assert fake_gdal.cache_max == 128 * 2**20
+    assert fake_gdal.options["CPL_VSIL_CURL_CACHE_SIZE"] == str(64 * 2**20)
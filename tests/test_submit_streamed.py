@@ -0,0 +1,100 @@
+"""Streaming submission of search results in STACReader."""
+
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from eof._source_configs import get_config
+from eof._stac_reader import STACReader
+
+
+class _Item:
+    def __init__(self, i):
+        self.id = f"item{i}"
+        self.datetime = i + 1
+        self.properties = {}
+
+
+def _search(n, yielded):
+    for i in range(n):
+        yielded.append(i)
+        yield _Item(i)
+
+
+def test_all_failing_items_stop_submission_early():
+    reader = STACReader(get_config("aws"))
+    yielded = []
+
+    def process(item):
+        time.sleep(0.01)
+        raise OSError("403 Forbidden")
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        with pytest.raises(RuntimeError, match="403 Forbidden"):
+            reader._submit_streamed(
+                _search(1000, yielded),
+                lambda item: pool.submit(process, item),
+                max_pending=8,
+            )
+    assert len(yielded) < 100
+
+
+def test_partial_failures_do_not_abort():
+    reader = STACReader(get_config("aws"))
+
+    def process(item):
+        # The single worker runs item0 first, so one success is recorded
+        # before the failures pile up
+        if item.id != "item0":
+            raise OSError("flaky")
+        return item.id
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        items, future_to_idx, n_found, n_cached, _ = reader._submit_streamed(
+            _search(50, []), lambda item: pool.submit(process, item),
+            max_pending=2,
+        )
+        for future in future_to_idx:
+            future.exception()
+    assert n_found == len(items) == 50
+    assert n_cached == 0
+
+
+def _done(result=None, error=None):
+    future = Future()
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+    return future
+
+
+def test_collect_results_aborts_on_the_shared_failure_count():
+    reader = STACReader(get_config("aws"))
+    items = [_Item(i) for i in range(5)]
+    future_to_idx = {_done(error=OSError("403 Forbidden")): i for i in range(5)}
+
+    with pytest.raises(RuntimeError, match="first 4 of 5 items failed"):
+        reader._collect_results(future_to_idx, items, desc="test")
+
+
+def test_collect_results_drops_failed_items():
+    reader = STACReader(get_config("aws"))
+    items = [_Item(i) for i in range(3)]
+    refl = np.ones((2, 4, 4), dtype=np.float32)
+    valid = np.ones((4, 4), dtype=bool)
+    future_to_idx = {
+        _done((refl, (0, 10, 0, 0, 0, -10), "crs", valid)): 0,
+        _done(error=OSError("flaky")): 1,
+        _done((refl * 2, (0, 10, 0, 0, 0, -10), "crs", valid)): 2,
+    }
+
+    refs, ok, mask, gt, crs = reader._collect_results(
+        future_to_idx, items, desc="test")
+
+    assert ok.tolist() == [True, False, True]
+    assert refs.shape == (2, 2, 4, 4)
+    np.testing.assert_array_equal(refs[1], refl * 2)
+    assert not mask.any() and crs == "crs"